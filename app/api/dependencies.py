@@ -12,7 +12,6 @@ from app.application.use_cases.stream_message import StreamMessageUseCase
 from app.infrastructure.auth.jwt_validator import get_jwt_validator, JWTValidationError
 from app.infrastructure.cache.redis_client import get_cache_client
 from app.infrastructure.config.settings import settings
-from app.domain.ports.cache_port import CachePort
 from app.domain.ports.repository_port import RepositoryPort
 import logging
 
@@ -22,12 +21,15 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
 
-def get_authenticated_user_id(
+async def get_authenticated_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
     """
     FastAPI dependency that validates JWT token and returns authenticated user ID.
     
+    Validation is a cheap HMAC check (and usually a cache hit), so it runs
+    directly on the event loop rather than occupying a threadpool worker.
+    
     This guard:
     1. Extracts the JWT from the Authorization: Bearer <token> header
     2. Validates the token using the shared JWT secret
@@ -68,12 +70,14 @@ def get_authenticated_user_id(
         )
 
 
-def get_process_message_use_case(request: Request) -> ProcessMessageUseCase:
+async def get_process_message_use_case(request: Request) -> ProcessMessageUseCase:
     """
     Get ProcessMessageUseCase instance with dependencies injected.
     
     This function uses the composition root to resolve all dependencies,
     ensuring proper dependency inversion and centralized composition.
+    It is async so FastAPI calls it on the event loop instead of
+    dispatching a trivial container lookup to the threadpool.
     
     Args:
         request: FastAPI request for correlation ID extraction.
@@ -85,7 +89,7 @@ def get_process_message_use_case(request: Request) -> ProcessMessageUseCase:
     return container.get_process_message_use_case(request)
 
 
-def get_stream_message_use_case(request: Request) -> StreamMessageUseCase:
+async def get_stream_message_use_case(request: Request) -> StreamMessageUseCase:
     """
     Get StreamMessageUseCase instance with dependencies injected.
     
@@ -102,7 +106,7 @@ def get_stream_message_use_case(request: Request) -> StreamMessageUseCase:
     return container.get_stream_message_use_case(request)
 
 
-def get_repository() -> RepositoryPort:
+async def get_repository() -> RepositoryPort:
     """
     Get Repository instance with dependencies injected.
     
@@ -1,6 +1,6 @@
 """Correlation ID middleware for request tracing."""
 import uuid
-from fastapi import Request, Response
+from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
@@ -0,0 +1,26 @@
+"""Custom response classes for the API layer."""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    orjson encodes straight to bytes in C, which is several times faster than
+    the stdlib json encoder used by JSONResponse. FastAPI's own ORJSONResponse
+    is deprecated in recent releases, so the API keeps its own equivalent.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """
+        Render content as JSON bytes.
+        
+        Args:
+            content: JSON-compatible content to encode.
+            
+        Returns:
+            Encoded JSON bytes.
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
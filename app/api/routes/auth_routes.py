@@ -1,14 +1,56 @@
 """Authentication API routes - Proxy to auth service."""
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from typing import Annotated, Optional
+from pydantic import BaseModel, StringConstraints
 import httpx
 import os
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Shared client so calls to the auth service reuse pooled keep-alive
+# connections instead of opening (and TLS-handshaking) a new one per request
+_auth_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_auth_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used to call the auth service.
+    
+    Returns:
+        httpx.AsyncClient instance (created on first use).
+    """
+    global _auth_http_client
+    
+    if _auth_http_client is None or _auth_http_client.is_closed:
+        _auth_http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    
+    return _auth_http_client
+
+
+async def close_auth_http_client() -> None:
+    """Close the shared auth service HTTP client (for shutdown)."""
+    global _auth_http_client
+    if _auth_http_client:
+        await _auth_http_client.aclose()
+        _auth_http_client = None
+
+
+# Cheap syntactic check only; the auth service performs full validation
+Email = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+    )
+]
+
 
 class MagicLinkRequest(BaseModel):
-    email: EmailStr
+    email: Email
 
 
 @router.post("/magic-link")
@@ -21,21 +63,21 @@ async def send_magic_link(request: MagicLinkRequest):
     auth_service_url = os.getenv("AUTH_SERVICE_URL", "http://localhost:3001")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{auth_service_url}/api/auth/request",
-                json={"email": request.email},
-                timeout=10.0
+        client = get_auth_http_client()
+        response = await client.post(
+            f"{auth_service_url}/api/auth/request",
+            json={"email": request.email},
+            timeout=10.0
+        )
+        
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=response.json().get("message", "Failed to send magic link")
             )
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=response.json().get("message", "Failed to send magic link")
-                )
-                
     except httpx.TimeoutException:
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
@@ -1,6 +1,7 @@
 """Chat API routes."""
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from app.api.dto.chat_dto import MessageRequestDTO, MessageResponseDTO
+from app.api.responses import ORJSONResponse
 from app.api.dependencies import (
     get_process_message_use_case,
     get_authenticated_user_id,
@@ -15,7 +16,11 @@ from app.infrastructure.exceptions import InfrastructureException
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
-@router.post("/message", response_model=MessageResponseDTO)
+@router.post(
+    "/message",
+    response_class=ORJSONResponse,
+    responses={200: {"model": MessageResponseDTO}}  # Documents the response in OpenAPI
+)
 async def send_message(
     payload: MessageRequestDTO,
     request: Request,
@@ -39,7 +44,7 @@ async def send_message(
         use_case: Injected process message use case.
         
     Returns:
-        MessageResponseDTO with the generated response.
+        ORJSONResponse with the MessageResponseDTO fields.
         
     Raises:
         HTTPException: If authentication fails or processing fails.
@@ -51,12 +56,14 @@ async def send_message(
             conversation_id=payload.conversation_id
         )
         
-        return MessageResponseDTO(
-            conversation_id=result["conversation_id"],
-            response=result["response"],
-            user_message=result["user_message"],
-            assistant_message=result["assistant_message"]
-        )
+        # Use case output is trusted, so it is encoded directly instead of
+        # going through response_model validation and serialization
+        return ORJSONResponse({
+            "conversation_id": result["conversation_id"],
+            "response": result["response"],
+            "user_message": result["user_message"],
+            "assistant_message": result["assistant_message"]
+        })
     except LLMError as e:
         # Domain exception: LLM operation failed
         raise HTTPException(
@@ -89,7 +96,7 @@ async def send_message(
         )
 
 
-@router.get("/health")
+@router.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
@@ -11,11 +11,41 @@ from app.application.use_cases.stream_message import StreamMessageUseCase
 from app.domain.exceptions import LLMError, RepositoryError
 from app.application.exceptions import ApplicationException
 from app.infrastructure.exceptions import InfrastructureException
-import json
+from app.infrastructure.config.settings import settings
+import asyncio
+from typing import List, Optional
+import orjson
 
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Pre-encoded SSE envelope: frames are yielded as bytes so Starlette does not
+# re-encode every chunk.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_CONVERSATION_ID_MARKER = "__CONVERSATION_ID__:"
+
+# Token-level LLM chunks are only a few bytes each, so most of the wire cost is
+# SSE framing and send() calls. After the first chunk (sent immediately, to
+# keep time-to-first-byte low), consecutive chunks are coalesced into one frame
+# until sse_coalesce_max_chars are pending or sse_coalesce_max_delay has passed
+# since the last frame. The delay is enforced with a timer, so buffered text
+# is sent even while the LLM is slow to produce the next chunk.
+
+
+def _sse_event(payload: dict) -> bytes:
+    """Encode a payload as a single SSE data frame."""
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
+
+
+def _flush_chunks(pending: List[str]) -> bytes:
+    """Encode pending text chunks as one SSE frame and clear them."""
+    if not pending:
+        return b""
+    frame = _sse_event({"chunk": "".join(pending)})
+    pending.clear()
+    return frame
+
 
 async def _format_sse_stream(use_case: StreamMessageUseCase, user_id: str, message: str, conversation_id: str = None):
     """
@@ -32,50 +62,92 @@ async def _format_sse_stream(use_case: StreamMessageUseCase, user_id: str, messa
         message: Message content.
         conversation_id: Optional conversation ID.
         
+    The first text chunk is sent as soon as it arrives; later consecutive
+    chunks are coalesced into a single frame (see settings.sse_coalesce_max_chars
+    and settings.sse_coalesce_max_delay). Buffered text is never held for
+    longer than the delay, whether or not another chunk arrives.
+    
     Yields:
-        SSE-formatted chunks.
+        SSE-formatted chunks as bytes.
     """
+    pending: List[str] = []
+    pending_chars = 0
+    max_chars = settings.sse_coalesce_max_chars
+    max_delay = settings.sse_coalesce_max_delay
+    loop = asyncio.get_running_loop()
+    last_flush = float("-inf")  # Nothing sent yet: flush the first chunk immediately
+    chunks = use_case.execute(
+        user_id=user_id,
+        message_content=message,
+        conversation_id=conversation_id
+    )
+    # Fetch of the next chunk, kept across a timed-out wait so no chunk is lost
+    next_chunk: Optional[asyncio.Future] = None
+    
     try:
         # Track conversation_id - it will be set when conversation is saved
         final_conversation_id = conversation_id
         
         # Stream chunks from use case
-        async for chunk in use_case.execute(
-            user_id=user_id,
-            message_content=message,
-            conversation_id=conversation_id
-        ):
+        while True:
+            if pending:
+                # Wait for the next chunk only until the buffered text is due
+                if next_chunk is None:
+                    next_chunk = asyncio.ensure_future(chunks.__anext__())
+                done, _ = await asyncio.wait(
+                    {next_chunk}, timeout=last_flush + max_delay - loop.time()
+                )
+                if not done:
+                    yield _flush_chunks(pending)
+                    pending_chars = 0
+                    last_flush = loop.time()
+                    continue
+            
+            try:
+                chunk = await (next_chunk if next_chunk is not None else chunks.__anext__())
+            except StopAsyncIteration:
+                break
+            finally:
+                next_chunk = None
+            
             # Check if this chunk contains conversation_id metadata
-            if isinstance(chunk, str) and chunk.startswith("__CONVERSATION_ID__:"):
-                final_conversation_id = chunk.replace("__CONVERSATION_ID__:", "")
+            if isinstance(chunk, str) and chunk.startswith(_CONVERSATION_ID_MARKER):
+                final_conversation_id = chunk[len(_CONVERSATION_ID_MARKER):]
                 # Send conversation_id as metadata event
-                metadata = json.dumps({"conversation_id": final_conversation_id})
-                yield f"data: {metadata}\n\n"
+                yield _flush_chunks(pending) + _sse_event({"conversation_id": final_conversation_id})
                 continue
             
-            # Format as SSE (Server-Sent Events)
-            data = json.dumps({"chunk": chunk})
-            yield f"data: {data}\n\n"
+            # Coalesce text chunks into fewer SSE (Server-Sent Events) frames
+            pending.append(chunk)
+            pending_chars += len(chunk)
+            now = loop.time()
+            if pending_chars >= max_chars or now - last_flush >= max_delay:
+                yield _flush_chunks(pending)
+                pending_chars = 0
+                last_flush = now
         
         # Send completion event with conversation_id
         completion_data = {"done": True}
         if final_conversation_id:
             completion_data["conversation_id"] = final_conversation_id
         
-        # Send completion event
-        yield f"data: {json.dumps(completion_data)}\n\n"
+        # Send any remaining text followed by the completion event
+        yield _flush_chunks(pending) + _sse_event(completion_data)
     except LLMError as e:
-        # Send error event
-        error_data = json.dumps({"error": str(e), "type": "llm_error"})
-        yield f"data: {error_data}\n\n"
+        # Send error event (after any text already received)
+        yield _flush_chunks(pending) + _sse_event({"error": str(e), "type": "llm_error"})
     except RepositoryError as e:
         # Send error event
-        error_data = json.dumps({"error": str(e), "type": "repository_error"})
-        yield f"data: {error_data}\n\n"
+        yield _flush_chunks(pending) + _sse_event({"error": str(e), "type": "repository_error"})
     except Exception as e:
         # Send unexpected error event
-        error_data = json.dumps({"error": str(e), "type": "unexpected_error"})
-        yield f"data: {error_data}\n\n"
+        yield _flush_chunks(pending) + _sse_event({"error": str(e), "type": "unexpected_error"})
+    finally:
+        # Client went away mid-stream: stop the in-flight fetch, then the use case
+        if next_chunk is not None:
+            next_chunk.cancel()
+            await asyncio.wait({next_chunk})
+        await chunks.aclose()
 
 
 @router.post("/message/stream")
@@ -1,11 +1,13 @@
 """Conversation history API routes."""
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from typing import List
 from app.api.dependencies import (
     get_repository,
     get_authenticated_user_id
 )
 from app.domain.ports.repository_port import RepositoryPort
+from app.domain.entities.conversation import Conversation
 from app.domain.exceptions import RepositoryError
 from pydantic import BaseModel
 from datetime import datetime
@@ -13,6 +15,10 @@ from datetime import datetime
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+# Routes with a response_model keep JSONResponse: FastAPI then serializes the
+# model straight to JSON bytes in pydantic-core, which beats orjson over an
+# intermediate dict. The app-wide default (ORJSONResponse) would disable that.
+
 
 class MessageDTO(BaseModel):
     """Message data transfer object."""
@@ -40,7 +46,11 @@ class ConversationSummaryDTO(BaseModel):
     last_message_preview: str
 
 
-@router.get("", response_model=List[ConversationSummaryDTO])
+@router.get(
+    "",
+    response_model=List[ConversationSummaryDTO],
+    response_class=JSONResponse
+)
 async def get_user_conversations(
     user_id: str = Depends(get_authenticated_user_id),
     repository: RepositoryPort = Depends(get_repository)
@@ -98,7 +108,11 @@ async def get_user_conversations(
         )
 
 
-@router.get("/{conversation_id}", response_model=ConversationDTO)
+@router.get(
+    "/{conversation_id}",
+    response_model=ConversationDTO,
+    response_class=JSONResponse
+)
 async def get_conversation_by_id(
     conversation_id: str,
     user_id: str = Depends(get_authenticated_user_id),
@@ -122,7 +136,9 @@ async def get_conversation_by_id(
         HTTPException: If conversation not found or doesn't belong to user.
     """
     try:
-        conversation = await repository.find_by_id(conversation_id)
+        conversation = None
+        if Conversation.is_valid_id(conversation_id):
+            conversation = await repository.find_by_id(conversation_id)
         
         if conversation is None:
             raise HTTPException(
@@ -194,7 +210,9 @@ async def delete_conversation(
     """
     try:
         # First verify the conversation exists and belongs to the user
-        conversation = await repository.find_by_id(conversation_id)
+        conversation = None
+        if Conversation.is_valid_id(conversation_id):
+            conversation = await repository.find_by_id(conversation_id)
         
         if conversation is None:
             raise HTTPException(
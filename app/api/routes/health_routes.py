@@ -1,15 +1,22 @@
 """Health check routes."""
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from app.api.responses import ORJSONResponse
 from app.bootstrap import get_container
-from app.domain.ports.llm_port import LLMPort
-from app.domain.ports.repository_port import RepositoryPort
 
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# Readiness probes arrive in bursts (several replicas, load balancer and
+# orchestrator polling at once). A healthy result is reused for this long so
+# they don't each hit the LLM provider and the database.
+_READINESS_CACHE_SECONDS = 1.0
+_last_ready: Optional[Tuple[float, Dict[str, Any]]] = None
 
-@router.get("")
+
+@router.get("", response_class=ORJSONResponse)
 async def health_check():
     """
     Basic health check endpoint.
@@ -20,7 +27,7 @@ async def health_check():
     return {"status": "ok"}
 
 
-@router.get("/ready")
+@router.get("/ready", response_class=ORJSONResponse)
 async def readiness_check():
     """
     Readiness check endpoint.
@@ -29,9 +36,18 @@ async def readiness_check():
     - Checking LLM provider connectivity
     - Checking repository/database connectivity
     
+    A healthy result is cached for _READINESS_CACHE_SECONDS; unhealthy results
+    are never cached so recovery is reported on the next probe.
+    
     Returns:
-        JSONResponse with status and component checks.
+        ORJSONResponse with status and component checks.
     """
+    global _last_ready
+    
+    now = time.monotonic()
+    if _last_ready is not None and now - _last_ready[0] < _READINESS_CACHE_SECONDS:
+        return _last_ready[1]
+    
     container = get_container()
     checks = {
         "status": "ready",
@@ -39,14 +55,14 @@ async def readiness_check():
     }
     all_healthy = True
     
-    # Check LLM provider with real connectivity test
+    # Check LLM provider with real connectivity test. The raw provider is
+    # probed: through get_llm() a cached answer would report healthy
+    # without ever reaching the provider.
     try:
-        llm = container.get_llm()
+        llm = container.get_llm_provider()
         
         # Test real connectivity by attempting to generate a minimal response
         # Use a timeout to avoid hanging
-        import asyncio
-        
         try:
             # For MockProvider, this will work immediately
             # For real providers, this tests actual API connectivity
@@ -110,30 +126,21 @@ async def readiness_check():
             }
             all_healthy = False
     except Exception as e:
-        # If it's a "not found" error, that's fine - repository is working
-        error_str = str(e).lower()
-        if "not found" in error_str or "none" in error_str:
-            checks["checks"]["repository"] = {"status": "healthy"}
-        elif "connection" in error_str or "timeout" in error_str:
-            checks["checks"]["repository"] = {
-                "status": "unhealthy",
-                "error": f"Database connectivity error: {str(e)}"
-            }
-            all_healthy = False
-        else:
-            checks["checks"]["repository"] = {
-                "status": "unhealthy",
-                "error": f"Repository error: {str(e)}"
-            }
-            all_healthy = False
+        # Repository could not be created (e.g., invalid DATABASE_URL)
+        checks["checks"]["repository"] = {
+            "status": "unhealthy",
+            "error": f"Failed to initialize repository: {str(e)}"
+        }
+        all_healthy = False
     
     # Set overall status
     if not all_healthy:
         checks["status"] = "not_ready"
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content=checks
         )
     
+    _last_ready = (now, checks)
     return checks
 
@@ -1,4 +1,5 @@
 """Use case for processing a message."""
+import asyncio
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -35,6 +36,9 @@ class ProcessMessageUseCase:
     - The conversation is automatically saved after processing
     """
     
+    # Built per request when a correlation ID is bound to the logger
+    __slots__ = ("llm", "repository", "logger")
+    
     def __init__(
         self,
         llm: LLMPort,
@@ -101,7 +105,13 @@ class ProcessMessageUseCase:
                 conversation = None
                 try:
                     if conversation_id:
-                        conversation = await self.repository.find_by_id(conversation_id)
+                        # Malformed IDs cannot exist, so skip the repository round-trip
+                        if Conversation.is_valid_id(conversation_id):
+                            # Warm up the LLM while the conversation loads
+                            conversation, _ = await asyncio.gather(
+                                self.repository.find_by_id(conversation_id),
+                                self.llm.warmup()
+                            )
                         if conversation is None:
                             # If conversation_id provided but not found, create a new one
                             # This allows frontend to work even if conversation wasn't created via API first
@@ -149,9 +159,8 @@ class ProcessMessageUseCase:
                         )
                     conversation = Conversation(user_id=user_id)
             
-            # Create user message value object
+            # Create user message value object (added together with the reply below)
             user_message = Message(content=message_content, role="user")
-            conversation.add_message(user_message)
             
             # Generate response using LLM (with tracing)
             with tracer.start_as_current_span("llm.generate") as llm_span:
@@ -159,7 +168,11 @@ class ProcessMessageUseCase:
                 try:
                     if self.logger:
                         self.logger.debug("Calling LLM to generate response")
-                    response_content = await self.llm.generate(message_content)
+                    # Earlier turns are sent as history so the provider can
+                    # reuse its prompt cache for the unchanged prefix
+                    history = conversation.messages
+                    llm_span.set_attribute("llm.history_length", len(history))
+                    response_content = await self.llm.generate(message_content, history=history)
                     llm_span.set_attribute("llm.response_length", len(response_content))
                     if self.logger:
                         self.logger.debug(
@@ -179,7 +192,7 @@ class ProcessMessageUseCase:
             
             # Create assistant message value object
             assistant_message = Message(content=response_content, role="assistant")
-            conversation.add_message(assistant_message)
+            conversation.add_exchange(user_message, assistant_message)
             
             # Save conversation (with tracing)
             # Graceful degradation: If save fails, return response anyway
@@ -3,6 +3,7 @@
 This use case handles streaming responses while maintaining data persistence
 and following Clean Architecture principles.
 """
+import asyncio
 from typing import Optional, AsyncGenerator
 from io import StringIO
 from app.domain.ports.llm_port import LLMPort
@@ -34,6 +35,9 @@ class StreamMessageUseCase:
     - If conversation_id is provided, it must exist
     """
     
+    # Built per request when a correlation ID is bound to the logger
+    __slots__ = ("llm", "repository", "logger")
+    
     def __init__(
         self,
         llm: LLMPort,
@@ -91,7 +95,14 @@ class StreamMessageUseCase:
         
         # 1. Load or create conversation
         if conversation_id:
-            conversation = await self.repository.find_by_id(conversation_id)
+            # Malformed IDs cannot exist, so skip the repository round-trip
+            conversation = None
+            if Conversation.is_valid_id(conversation_id):
+                # Warm up the LLM while the conversation loads
+                conversation, _ = await asyncio.gather(
+                    self.repository.find_by_id(conversation_id),
+                    self.llm.warmup()
+                )
             if conversation is None:
                 # If conversation_id provided but not found, create a new one
                 # This allows frontend to work even if conversation wasn't created via API first
@@ -146,7 +157,9 @@ class StreamMessageUseCase:
                 self.logger.debug("Starting LLM stream generation")
             
             chunk_count = 0
-            async for chunk in self.llm.generate_stream(message_content):
+            # Earlier turns are sent as history (everything but the new user message)
+            history = conversation.messages[:-1]
+            async for chunk in self.llm.generate_stream(message_content, history=history):
                 if chunk:  # Only process non-empty chunks
                     chunk_length = len(chunk)
                     current_length += chunk_length
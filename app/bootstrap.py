@@ -6,6 +6,7 @@ ensuring that dependency resolution happens at the application's entry point.
 
 All adapters, services, and use cases are wired together here.
 """
+import threading
 from typing import Optional
 from fastapi import Request
 
@@ -16,9 +17,14 @@ from app.application.use_cases.process_message import ProcessMessageUseCase
 from app.application.use_cases.stream_message import StreamMessageUseCase
 
 # Infrastructure implementations
-from app.infrastructure.llm.factory import create_llm_provider
+from app.infrastructure.llm.factory import create_llm_provider, clear_llm_provider_cache
+from app.infrastructure.llm.caching_provider import CachingLLMProvider
+from app.infrastructure.llm.batcher import AsyncDynamicBatcher
+from app.infrastructure.llm.semantic_cache import SemanticCache, SemanticCachingLLMProvider
+from app.infrastructure.cache.redis_client import get_cache_client
+from app.infrastructure.cache.memory_cache import InMemoryCache
 from app.infrastructure.persistence import InMemoryRepository, PostgresRepository
-from app.infrastructure.logging import StructuredLogger, NullLogger
+from app.infrastructure.logging import StructuredLogger
 from app.infrastructure.config.settings import settings
 
 
@@ -36,19 +42,87 @@ class ApplicationContainer:
     def __init__(self):
         """Initialize the application container."""
         self._llm: Optional[LLMPort] = None
+        # The provider underneath the batcher/caches, for health checks
+        self._llm_provider: Optional[LLMPort] = None
         self._repository: Optional[RepositoryPort] = None
+        # Guards lazy creation so the container stays safe to reach from other
+        # threads (e.g. sync code run in the threadpool while the lifespan or a
+        # request is creating the same client/engine). On the event loop alone
+        # creation never awaits, so it cannot interleave there.
+        self._lock = threading.Lock()
     
     def get_llm(self) -> LLMPort:
         """
         Get LLM provider instance (singleton).
         
+        The provider is created once and reused across requests so the SDK's
+        HTTP connection pool (keep-alive, TLS sessions) survives between calls.
+        When LLM_BATCHING_ENABLED is set, concurrent calls are coalesced into
+        batches. When LLM_RESPONSE_CACHE_ENABLED is set, the provider is
+        wrapped so identical prompts are served from the cache (before
+        reaching the batcher): Redis if configured, else an in-process LRU.
+        
         Returns:
             LLM provider implementing LLMPort.
         """
         if self._llm is None:
-            self._llm = create_llm_provider()
+            with self._lock:
+                if self._llm is None:
+                    self._llm = self._create_llm()
         return self._llm
     
+    def get_llm_provider(self) -> LLMPort:
+        """
+        Get the raw LLM provider, without the batcher or response caches.
+        
+        Calls through get_llm() can be answered from a cache without
+        contacting the provider; use this when the provider itself must be
+        reached, e.g. for readiness checks.
+        
+        Returns:
+            The provider instance wrapped by get_llm().
+        """
+        self.get_llm()
+        return self._llm_provider
+    
+    def _create_llm(self) -> LLMPort:
+        """Create the configured LLM provider, wrapped in the batcher/caches if enabled."""
+        provider = create_llm_provider()
+        self._llm_provider = provider
+        llm = provider
+        if settings.llm_batching_enabled:
+            llm = AsyncDynamicBatcher(
+                provider=llm,
+                max_batch_size=settings.llm_batch_max_size,
+                batch_wait_timeout_s=settings.llm_batch_wait_timeout
+            )
+        
+        # Semantic cache needs a provider that can embed prompts (OpenAI)
+        if settings.llm_semantic_cache_enabled and hasattr(provider, "embed"):
+            llm = SemanticCachingLLMProvider(
+                provider=llm,
+                embed=provider.embed,
+                cache=SemanticCache(
+                    max_entries=settings.llm_semantic_cache_max_entries,
+                    threshold=settings.llm_semantic_cache_threshold
+                )
+            )
+        
+        if not settings.llm_response_cache_enabled:
+            return llm
+        
+        # Fall back to a per-process cache when Redis is not configured
+        cache = get_cache_client()
+        if cache is None:
+            cache = InMemoryCache(max_entries=settings.llm_response_cache_max_entries)
+        
+        return CachingLLMProvider(
+            provider=llm,
+            cache=cache,
+            namespace=f"{settings.llm_provider}:{settings.openai_model}",
+            ttl_seconds=settings.llm_response_cache_ttl
+        )
+    
     def get_repository(self) -> RepositoryPort:
         """
         Get repository instance (singleton).
@@ -60,10 +134,12 @@ class ApplicationContainer:
             Repository implementing RepositoryPort.
         """
         if self._repository is None:
-            if settings.database_url:
-                self._repository = PostgresRepository()
-            else:
-                self._repository = InMemoryRepository()
+            with self._lock:
+                if self._repository is None:
+                    if settings.database_url:
+                        self._repository = PostgresRepository()
+                    else:
+                        self._repository = InMemoryRepository()
         return self._repository
     
     def get_logger(self, request: Optional[Request] = None) -> LoggerPort:
@@ -148,8 +224,11 @@ class ApplicationContainer:
         
         This clears all cached instances, forcing recreation on next access.
         """
-        self._llm = None
-        self._repository = None
+        with self._lock:
+            self._llm = None
+            self._llm_provider = None
+            self._repository = None
+        clear_llm_provider_cache()
 
 
 # Global container instance
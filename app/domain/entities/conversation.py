@@ -1,11 +1,15 @@
 """Conversation entity."""
+import re
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 from app.domain.value_objects.message import Message
 
+# Conversation IDs are assigned by repositories as str(uuid.uuid4())
+_ID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
 
-@dataclass
+
+@dataclass(slots=True)
 class Conversation:
     """
     Conversation entity representing a user's conversation session.
@@ -26,18 +30,53 @@ class Conversation:
     messages: List[Message] = field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # How many leading messages are already in storage. Set by repositories
+    # when loading or saving, so a save only writes the messages added since.
+    persisted_message_count: int = field(default=0, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize timestamps if not provided."""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
     
     def add_message(self, message: Message) -> None:
-        """Add a message to the conversation."""
+        """
+        Add a message to the conversation.
+        
+        The message's own timestamp (set when it was created) advances the
+        conversation's updated_at, avoiding a second clock read per message.
+        updated_at never moves backwards, preserving created_at <= updated_at.
+        """
         self.messages.append(message)
-        self.updated_at = datetime.now()
+        timestamp = message.timestamp or datetime.now()
+        if self.updated_at is None or timestamp > self.updated_at:
+            self.updated_at = timestamp
+    
+    def add_exchange(self, user_message: Message, assistant_message: Message) -> None:
+        """
+        Add a user message and the assistant's reply in one step.
+        
+        Equivalent to two add_message calls: both messages are appended with
+        a single list extension and updated_at advances once, to the reply's
+        timestamp.
+        """
+        self.messages.extend((user_message, assistant_message))
+        timestamp = assistant_message.timestamp or user_message.timestamp or datetime.now()
+        if self.updated_at is None or timestamp > self.updated_at:
+            self.updated_at = timestamp
+    
+    @staticmethod
+    def is_valid_id(conversation_id: str) -> bool:
+        """
+        Check whether a conversation ID has the format repositories assign.
+        
+        Lets callers skip a repository lookup for IDs that cannot exist.
+        """
+        return _ID_RE.fullmatch(conversation_id) is not None
     
     def get_last_message(self) -> Optional[Message]:
         """Get the last message in the conversation."""
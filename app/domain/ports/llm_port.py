@@ -1,4 +1,6 @@
-from typing import Protocol, AsyncGenerator, Optional
+import asyncio
+from typing import Protocol, AsyncGenerator, List, Optional, Sequence, Union
+from app.domain.value_objects.message import Message
 
 
 class LLMPort(Protocol):
@@ -11,14 +13,28 @@ class LLMPort(Protocol):
     Any class implementing this protocol must provide:
     - An async generate method that returns a complete response string
     - An async generate_stream method that yields response chunks (for streaming)
+    
+    Both methods accept the prior conversation turns as history. Sending the
+    history as structured messages (rather than only the latest prompt) gives
+    the model context and lets providers reuse their prompt-prefix cache for
+    the unchanged start of the conversation.
+    
+    Implementations that subclass the protocol also inherit a default
+    generate_batch, which runs generate concurrently for several prompts,
+    and a no-op warmup.
     """
     
-    async def generate(self, message: str) -> str:
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
         """
         Generate a response from the LLM based on the input message.
         
         Args:
             message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation, oldest first.
             
         Returns:
             The generated response from the LLM as a string.
@@ -32,7 +48,11 @@ class LLMPort(Protocol):
         """
         ...
     
-    async def generate_stream(self, message: str) -> AsyncGenerator[str, None]:
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming response from the LLM.
         
@@ -41,6 +61,7 @@ class LLMPort(Protocol):
         
         Args:
             message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation, oldest first.
             
         Yields:
             String chunks of the generated response.
@@ -52,4 +73,43 @@ class LLMPort(Protocol):
             - Network errors
             - Invalid input
         """
-        ...
\ No newline at end of file
+        ...
+    
+    async def generate_batch(
+        self,
+        messages: List[str],
+        histories: Optional[List[Optional[Sequence[Message]]]] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Generate responses for several messages in one call.
+        
+        The default implementation runs generate() concurrently, so all
+        requests share the provider's HTTP connection pool. Providers with a
+        native batch API can override it. A message that fails does not fail
+        the others: its slot in the result holds the exception instead.
+        
+        Args:
+            messages: The input messages/prompts to send to the LLM.
+            histories: Optional per-message conversation history, aligned
+                       with messages.
+            
+        Returns:
+            One entry per message, in the same order: the generated response,
+            or the exception raised while generating it.
+        """
+        if histories is None:
+            histories = [None] * len(messages)
+        return list(await asyncio.gather(
+            *(self.generate(m, history=h) for m, h in zip(messages, histories)),
+            return_exceptions=True
+        ))
+    
+    async def warmup(self) -> None:
+        """
+        Prepare the provider for an upcoming request.
+        
+        Called by use cases while they wait on other I/O (e.g. loading the
+        conversation), so work such as opening a connection overlaps with it.
+        Must be cheap and must never raise. The default does nothing.
+        """
+        return None
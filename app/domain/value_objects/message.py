@@ -3,8 +3,12 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+# Allowed roles, mapped to one canonical string object each so roles loaded
+# from storage don't keep a separate copy of the string per message
+_ROLES = {"user": "user", "assistant": "assistant"}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Message:
     """
     Value object representing a message in the conversation.
@@ -23,11 +27,14 @@ class Message:
     timestamp: Optional[datetime] = None
     
     def __post_init__(self):
-        """Validate message content."""
+        """Validate message content and role."""
         if not self.content or not self.content.strip():
             raise ValueError("Message content cannot be empty")
-        if self.role not in ["user", "assistant"]:
+        role = _ROLES.get(self.role) if isinstance(self.role, str) else None
+        if role is None:
             raise ValueError("Message role must be 'user' or 'assistant'")
+        if role is not self.role:
+            object.__setattr__(self, 'role', role)
         
         # Set timestamp if not provided (using object.__setattr__ for frozen dataclass)
         if self.timestamp is None:
@@ -3,7 +3,10 @@
 This module handles JWT token validation using a symmetric secret key (HS256).
 It validates tokens issued by our magic link authentication microservice.
 """
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+import threading
+import time
 from jose import jwt, JWTError
 from jose.constants import ALGORITHMS
 from app.infrastructure.config.settings import settings
@@ -30,11 +33,20 @@ class JWTValidator:
     Note: This uses symmetric key encryption (HS256) since both the auth service
     and backend share the same secret. For production with multiple services,
     consider using asymmetric keys (RS256) or an API validation endpoint.
+    
+    Clients send the same bearer token on every request until it expires, so
+    get_user_id remembers the user ID of recently validated tokens until
+    their 'exp' claim instead of re-verifying the signature each time.
     """
     
+    # Maximum number of validated tokens remembered by get_user_id
+    USER_ID_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the JWT validator."""
-        pass
+        # token -> (user_id, exp timestamp), least recently used first
+        self._user_id_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
@@ -109,13 +121,59 @@ class JWTValidator:
         Raises:
             JWTValidationError: If token is invalid or missing email claim.
         """
+        cached = self._get_cached_user_id(token)
+        if cached is not None:
+            return cached
+        
         payload = self.validate_token(token)
         email = payload.get("email")
         
         if not email:
             raise JWTValidationError("Token missing 'email' claim")
         
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            self._cache_user_id(token, email, float(exp))
+        
         return email
+    
+    def _get_cached_user_id(self, token: str) -> Optional[str]:
+        """
+        Return the user ID of a previously validated, still unexpired token.
+        
+        Args:
+            token: The JWT token string.
+            
+        Returns:
+            The cached user ID, or None if the token is unknown or expired.
+        """
+        with self._cache_lock:
+            entry = self._user_id_cache.get(token)
+            if entry is None:
+                return None
+            
+            user_id, exp = entry
+            if time.time() >= exp:
+                del self._user_id_cache[token]
+                return None
+            
+            self._user_id_cache.move_to_end(token)
+            return user_id
+    
+    def _cache_user_id(self, token: str, user_id: str, exp: float) -> None:
+        """
+        Remember the user ID of a validated token until it expires.
+        
+        Args:
+            token: The validated JWT token string.
+            user_id: The user ID extracted from the token.
+            exp: The token's expiration time (Unix timestamp).
+        """
+        with self._cache_lock:
+            self._user_id_cache[token] = (user_id, exp)
+            self._user_id_cache.move_to_end(token)
+            while len(self._user_id_cache) > self.USER_ID_CACHE_SIZE:
+                self._user_id_cache.popitem(last=False)
 
 
 # Global validator instance (singleton)
@@ -0,0 +1,150 @@
+"""In-memory cache implementation.
+
+This module provides a process-local, size-bounded implementation of the
+CachePort interface. It is used when Redis is not configured, so features
+built on the cache (such as the LLM response cache) still work in a single
+worker without extra infrastructure.
+"""
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Tuple
+from app.domain.ports.cache_port import CachePort
+
+
+class InMemoryCache(CachePort):
+    """
+    In-memory LRU cache with per-entry TTL.
+    
+    Entries are evicted least-recently-used first once max_entries is
+    reached, and expired entries are dropped lazily when they are read.
+    Values are stored as-is (not serialized) and are not shared between
+    worker processes.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept before evicting the
+                         least recently used one.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.max_entries = max_entries
+        # key -> (expires_at, value); expires_at is a monotonic time or None
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+    
+    def _lookup(self, key: str) -> Optional[Tuple[Optional[float], Any]]:
+        """Return the live entry for key (marking it recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at = entry[0]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _store(self, key: str, value: Any, ttl_seconds: Optional[int]) -> None:
+        """Store an entry, evicting the least recently used one if full."""
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            Cached value if found and not expired, None otherwise.
+        """
+        entry = self._lookup(key)
+        return entry[1] if entry is not None else None
+    
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None
+    ) -> bool:
+        """
+        Set a value in the cache with optional TTL.
+        
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl_seconds: Time to live in seconds. If None, no expiration.
+        
+        Returns:
+            Always True.
+        """
+        self._store(key, value, ttl_seconds)
+        return True
+    
+    async def delete(self, key: str) -> bool:
+        """
+        Delete a key from the cache.
+        
+        Args:
+            key: Cache key to delete.
+        
+        Returns:
+            True if deleted, False if key didn't exist.
+        """
+        return self._entries.pop(key, None) is not None
+    
+    async def increment(
+        self,
+        key: str,
+        amount: int = 1,
+        ttl_seconds: Optional[int] = None
+    ) -> int:
+        """
+        Increment a numeric value in the cache.
+        
+        If the key doesn't exist, it is created with the increment value and
+        the TTL is applied; incrementing an existing key keeps its expiry.
+        
+        Args:
+            key: Cache key.
+            amount: Amount to increment (default: 1).
+            ttl_seconds: Time to live in seconds for a new key.
+        
+        Returns:
+            The new value after increment.
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self._store(key, amount, ttl_seconds)
+            return amount
+        
+        expires_at, value = entry
+        new_value = int(value) + amount
+        self._entries[key] = (expires_at, new_value)
+        return new_value
+    
+    async def exists(self, key: str) -> bool:
+        """
+        Check if a key exists in the cache.
+        
+        Args:
+            key: Cache key to check.
+        
+        Returns:
+            True if key exists and has not expired, False otherwise.
+        """
+        return self._lookup(key) is not None
+    
+    async def close(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
@@ -4,7 +4,7 @@ This module provides a Redis-based implementation of the CachePort interface.
 It uses aioredis (via redis[asyncio]) for async Redis operations.
 """
 from typing import Optional, Any
-import json
+import orjson
 import logging
 from redis.asyncio import Redis, ConnectionPool
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
@@ -110,8 +110,8 @@ class RedisCacheClient(CachePort):
             
             # Deserialize JSON
             try:
-                return json.loads(value.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 # If not JSON, return as string
                 return value.decode('utf-8')
                 
@@ -148,7 +148,7 @@ class RedisCacheClient(CachePort):
                 serialized = value.encode('utf-8') if isinstance(value, str) else value
             else:
                 # Complex objects: serialize to JSON
-                serialized = json.dumps(value).encode('utf-8')
+                serialized = orjson.dumps(value)
             
             # Set with optional TTL
             if ttl_seconds:
@@ -158,7 +158,7 @@ class RedisCacheClient(CachePort):
             
             return bool(result)
             
-        except (RedisError, json.JSONEncodeError) as e:
+        except (RedisError, orjson.JSONEncodeError) as e:
             logger.warning(f"Redis set error for key '{key}': {e}")
             return False
         except Exception as e:
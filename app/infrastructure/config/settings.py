@@ -1,5 +1,6 @@
 """Application settings and configuration."""
 from typing import Optional, List
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -31,6 +32,27 @@ class Settings(BaseSettings):
     llm_circuit_breaker_failure_threshold: int = 5  # Failures before opening circuit
     llm_circuit_breaker_recovery_timeout: int = 60  # seconds before attempting recovery
     
+    # LLM Response Cache Configuration (Redis if REDIS_URL is set, else in-process)
+    llm_response_cache_enabled: bool = False  # Serve identical prompts from cache
+    llm_response_cache_ttl: int = 3600  # seconds
+    llm_response_cache_max_entries: int = 1024  # In-process cache size (without Redis)
+    
+    # LLM Semantic Cache Configuration (OpenAI only, requires numpy)
+    llm_semantic_cache_enabled: bool = False  # Serve paraphrased prompts from cache
+    llm_semantic_cache_threshold: float = 0.95  # Minimum cosine similarity for a hit
+    llm_semantic_cache_max_entries: int = 5000
+    llm_embedding_model: str = "text-embedding-3-small"
+    
+    # LLM Request Batching Configuration
+    llm_batching_enabled: bool = False  # Coalesce concurrent generate() calls
+    llm_batch_max_size: int = 32  # Maximum messages per batch
+    llm_batch_wait_timeout: float = 0.002  # seconds to wait for a batch to fill
+    llm_batch_max_concurrency: int = 16  # Requests of one batch in flight at once
+    
+    # SSE Streaming Configuration (text chunks after the first are coalesced)
+    sse_coalesce_max_chars: int = 512  # Flush once this many characters are pending
+    sse_coalesce_max_delay: float = 0.02  # seconds - flush once this much time has passed
+    
     # Database Configuration
     database_url: Optional[str] = None
     db_pool_size: int = 10  # Number of connections to maintain in pool
@@ -57,6 +79,14 @@ class Settings(BaseSettings):
     
     # API Configuration
     api_prefix: str = "/api/v1"
+    
+    @field_validator("llm_provider", mode="before")
+    @classmethod
+    def normalize_llm_provider(cls, v):
+        """Lowercase the provider name once at load time, so callers can compare it directly."""
+        if isinstance(v, str):
+            return v.strip().lower()
+        return v
 
 
 # Global settings instance
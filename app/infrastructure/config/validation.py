@@ -1,7 +1,15 @@
 """Configuration validation on startup."""
+import importlib.util
+import logging
+import sys
 from app.infrastructure.config.settings import settings
 from app.infrastructure.exceptions import ConfigurationError
 
+logger = logging.getLogger(__name__)
+
+# Accepted DATABASE_URL schemes
+_DATABASE_URL_PREFIXES = ("postgresql://", "postgresql+asyncpg://")
+
 
 def validate_configuration():
     """
@@ -16,7 +24,7 @@ def validate_configuration():
     errors = []
     
     # Validate LLM provider configuration
-    provider = settings.llm_provider.lower()
+    provider = settings.llm_provider
     
     if provider == "openai":
         if not settings.openai_api_key:
@@ -33,7 +41,7 @@ def validate_configuration():
     
     # Validate database configuration (if provided)
     if settings.database_url:
-        if not settings.database_url.startswith(("postgresql://", "postgresql+asyncpg://")):
+        if not settings.database_url.startswith(_DATABASE_URL_PREFIXES):
             errors.append(
                 "DATABASE_URL must start with 'postgresql://' or 'postgresql+asyncpg://'. "
                 f"Got: {settings.database_url[:20]}..."
@@ -67,6 +75,14 @@ def validate_configuration():
         if settings.rate_limit_window_seconds < 1:
             errors.append("RATE_LIMIT_WINDOW_SECONDS must be at least 1 second")
     
+    # uvicorn runs on uvloop when it is installed (uvicorn[standard] pulls it in
+    # on Linux/macOS). It is not required, so a missing uvloop is only a warning.
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is None:
+        logger.warning(
+            "uvloop is not installed; running on the default asyncio event loop. "
+            "Install uvicorn[standard] for better I/O throughput."
+        )
+    
     # Raise error if any validation failed
     if errors:
         error_message = "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
@@ -1,6 +1,22 @@
-from app.infrastructure.llm.openai_provider import OpenAIProvider
-from app.infrastructure.llm.mock_provider import MockProvider
 from app.infrastructure.llm.factory import create_llm_provider
 
-__all__ = ["OpenAIProvider", "MockProvider", "create_llm_provider"]
+__all__ = ["OpenAIProvider", "MockProvider", "create_llm_provider", "CachingLLMProvider", "AsyncDynamicBatcher"]
 
+# Concrete providers and wrappers are imported on first access, so importing
+# the factory doesn't load every provider module (and its SDK).
+_LAZY_EXPORTS = {
+    "OpenAIProvider": "app.infrastructure.llm.openai_provider",
+    "MockProvider": "app.infrastructure.llm.mock_provider",
+    "CachingLLMProvider": "app.infrastructure.llm.caching_provider",
+    "AsyncDynamicBatcher": "app.infrastructure.llm.batcher",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    
+    return getattr(importlib.import_module(module_name), name)
@@ -0,0 +1,174 @@
+"""Dynamic request batching for LLM providers.
+
+Under concurrent load each HTTP request issues its own provider call. This
+module coalesces generate() calls that arrive within a short window into a
+single generate_batch() call on the wrapped provider, so requests share one
+round-trip (or one native batch request, for providers that support it).
+"""
+import asyncio
+import logging
+from typing import AsyncGenerator, List, Optional, Sequence, Set, Tuple, Union
+from app.domain.ports.llm_port import LLMPort
+from app.domain.value_objects.message import Message
+from app.domain.exceptions import LLMError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDynamicBatcher(LLMPort):
+    """
+    LLMPort decorator that batches concurrent generate() calls.
+    
+    Each generate() call registers a future and waits on it. Pending calls are
+    dispatched as one generate_batch() call as soon as max_batch_size calls are
+    queued or batch_wait_timeout_s has elapsed since the first one arrived.
+    
+    Streaming calls cannot be merged and are passed straight through.
+    """
+    
+    def __init__(
+        self,
+        provider: LLMPort,
+        max_batch_size: int = 32,
+        batch_wait_timeout_s: float = 0.002
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            provider: The LLM provider that executes the batches.
+            max_batch_size: Maximum number of messages sent in one batch.
+            batch_wait_timeout_s: Maximum time to wait for a batch to fill up.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.batch_wait_timeout_s = batch_wait_timeout_s
+        self._pending: List[Tuple[str, Optional[Sequence[Message]], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Keep references to running batches so they aren't garbage collected
+        self._batches: Set[asyncio.Task] = set()
+    
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
+        """
+        Generate a response as part of the next batch.
+        
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+        
+        Returns:
+            The generated response for this message.
+        
+        Raises:
+            The exception raised for this message, or by the provider's
+            generate_batch call as a whole.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((message, history, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait_timeout_s, self._dispatch)
+        
+        return await future
+    
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response directly from the provider (not batched).
+        
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+        
+        Yields:
+            String chunks of the generated response.
+        """
+        async for chunk in self.provider.generate_stream(message, history=history):
+            yield chunk
+    
+    async def generate_batch(
+        self,
+        messages: List[str],
+        histories: Optional[List[Optional[Sequence[Message]]]] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Send an already-assembled batch straight to the provider.
+        
+        Args:
+            messages: The input messages/prompts to send to the LLM.
+            histories: Optional per-message conversation history.
+        
+        Returns:
+            One response or exception per message, in the same order.
+        """
+        return await self.provider.generate_batch(messages, histories)
+    
+    async def warmup(self) -> None:
+        """Warm up the wrapped provider."""
+        await self.provider.warmup()
+    
+    def _dispatch(self) -> None:
+        """Send all pending messages to the provider as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _run_batch(
+        self,
+        batch: List[Tuple[str, Optional[Sequence[Message]], asyncio.Future]]
+    ) -> None:
+        """
+        Execute one batch and resolve the waiting futures.
+        
+        Each caller gets its own response, or the exception raised for its
+        own message, so one failing prompt does not fail the rest of the
+        batch. Only if the provider's batch call itself fails does every
+        caller receive that exception.
+        
+        Args:
+            batch: Pending (message, history, future) entries.
+        """
+        messages = [message for message, _, _ in batch]
+        histories = [history for _, history, _ in batch]
+        try:
+            responses = await self.provider.generate_batch(messages, histories)
+            if len(responses) != len(batch):
+                raise LLMError(
+                    f"LLM batch returned {len(responses)} responses for {len(batch)} messages"
+                )
+        except Exception as e:
+            logger.debug(f"LLM batch of {len(batch)} failed: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), response in zip(batch, responses):
+            # Callers that were cancelled while waiting are skipped
+            if future.done():
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
@@ -0,0 +1,180 @@
+"""Response-caching decorator for LLM providers.
+
+Identical prompts sent to the same model produce the same answer often enough
+that round-tripping to the provider every time wastes both latency and tokens.
+This module wraps any LLMPort implementation and serves repeated prompts from
+a CachePort (Redis in production).
+"""
+import asyncio
+import hashlib
+import logging
+import orjson
+from typing import AsyncGenerator, Dict, Optional, Sequence
+from app.domain.ports.cache_port import CachePort
+from app.domain.ports.llm_port import LLMPort
+from app.domain.value_objects.message import Message
+
+logger = logging.getLogger(__name__)
+
+
+class CachingLLMProvider(LLMPort):
+    """
+    LLMPort decorator that caches complete responses by prompt hash.
+
+    Cache keys are the SHA-256 of the model namespace, the conversation
+    history and the prompt, so switching models never serves a stale answer
+    from another model and the same prompt in a different conversation is a
+    separate entry. Cache failures are never fatal: the underlying provider
+    is called instead. Concurrent misses for the same key are collapsed into
+    a single provider call.
+    """
+
+    KEY_PREFIX = "llm:response:"
+
+    def __init__(
+        self,
+        provider: LLMPort,
+        cache: CachePort,
+        namespace: str,
+        ttl_seconds: Optional[int] = 3600
+    ):
+        """
+        Initialize the caching provider.
+
+        Args:
+            provider: The LLM provider to delegate cache misses to.
+            cache: Cache used to store responses.
+            namespace: Identifies the provider/model the responses belong to
+                       (e.g., 'openai:gpt-4o'). Part of every cache key.
+            ttl_seconds: Time to live for cached responses. None disables expiry.
+        """
+        self.provider = provider
+        self.cache = cache
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        # Per-key locks so concurrent identical prompts share one provider call,
+        # with the number of callers holding or waiting on each: a released
+        # lock reports unlocked even while waiters are queued, so the count
+        # decides when the entry can go
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+
+    def _cache_key(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
+        """
+        Build the cache key for a prompt.
+
+        Args:
+            message: The prompt sent to the LLM.
+            history: Earlier conversation messages sent along with the prompt.
+
+        Returns:
+            Namespaced SHA-256 hex digest of the model, history and prompt.
+        """
+        payload = orjson.dumps(
+            {
+                "model": self.namespace,
+                "history": [[m.role, m.content] for m in history or ()],
+                "message": message
+            },
+            option=orjson.OPT_SORT_KEYS
+        )
+        return self.KEY_PREFIX + hashlib.sha256(payload).hexdigest()
+
+    async def _get_cached(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss or cache error."""
+        try:
+            cached = await self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            return None
+        return cached if isinstance(cached, str) else None
+
+    async def _store(self, key: str, response: str) -> None:
+        """Store a response, ignoring cache errors."""
+        if not response:
+            return
+        try:
+            await self.cache.set(key, response, ttl_seconds=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM response cache store failed: {e}")
+
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
+        """
+        Generate a response, serving repeated prompts from the cache.
+
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+
+        Returns:
+            The cached or freshly generated response.
+        """
+        key = self._cache_key(message, history)
+        cached = await self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        # On a miss only the first caller generates; identical prompts that
+        # arrive meanwhile wait for it and are then served from the cache
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                cached = await self._get_cached(key)
+                if cached is not None:
+                    return cached
+
+                response = await self.provider.generate(message, history=history)
+                await self._store(key, response)
+                return response
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response, serving repeated prompts from the cache.
+
+        On a hit the cached response is yielded as a single chunk. On a miss
+        chunks are passed through as they arrive and the assembled response is
+        cached once the stream completes successfully.
+
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+
+        Yields:
+            String chunks of the response.
+        """
+        key = self._cache_key(message, history)
+        cached = await self._get_cached(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async for chunk in self.provider.generate_stream(message, history=history):
+            chunks.append(chunk)
+            yield chunk
+
+        await self._store(key, "".join(chunks))
+
+    async def warmup(self) -> None:
+        """Warm up the wrapped provider."""
+        await self.provider.warmup()
@@ -1,11 +1,47 @@
 """Factory for creating LLM provider instances based on configuration."""
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional
 from app.domain.ports.llm_port import LLMPort
-from app.infrastructure.llm.openai_provider import OpenAIProvider
-from app.infrastructure.llm.mock_provider import MockProvider
 from app.infrastructure.config.settings import settings
 
 
+def _create_openai_provider(
+    api_key: Optional[str],
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int
+) -> LLMPort:
+    """Create an OpenAIProvider (imported on demand)."""
+    from app.infrastructure.llm.openai_provider import OpenAIProvider
+    
+    return OpenAIProvider(
+        api_key=api_key,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
+
+def _create_mock_provider(
+    api_key: Optional[str],
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int
+) -> LLMPort:
+    """Create a MockProvider (imported on demand)."""
+    from app.infrastructure.llm.mock_provider import MockProvider
+    
+    return MockProvider()
+
+
+# Provider name -> builder. Providers are only imported when first selected,
+# so unused SDKs never load.
+_PROVIDERS: Dict[str, Callable[..., LLMPort]] = {
+    "openai": _create_openai_provider,
+    "mock": _create_mock_provider,
+}
+
+
 def create_llm_provider(
     provider: Optional[str] = None,
     **kwargs
@@ -16,6 +52,10 @@ def create_llm_provider(
     This factory follows the Dependency Inversion Principle by returning
     a domain port (LLMPort) rather than a concrete implementation.
     
+    Providers are memoized by their resolved configuration, so repeated
+    calls with the same settings share one instance (and its HTTP client).
+    Use clear_llm_provider_cache() to force new instances.
+    
     Args:
         provider: The LLM provider to use. Options: 'openai', 'mock'.
                   If not provided, uses settings.llm_provider.
@@ -32,22 +72,42 @@ def create_llm_provider(
     """
     # Use settings provider if not specified
     if provider is None:
-        provider = settings.llm_provider.lower()
+        provider = settings.llm_provider
     else:
         provider = provider.lower()
     
-    if provider == "openai":
-        return OpenAIProvider(
-            api_key=kwargs.get("api_key") or settings.openai_api_key,
-            model=kwargs.get("model") or settings.openai_model,
-            temperature=kwargs.get("temperature", 0.7),
-            max_tokens=kwargs.get("max_tokens", 500)
-        )
-    elif provider == "mock":
-        return MockProvider()
-    else:
+    if provider not in _PROVIDERS:
         raise ValueError(
             f"Unknown LLM provider: {provider}. "
-            "Supported providers: 'openai', 'mock'"
+            f"Supported providers: {', '.join(repr(name) for name in _PROVIDERS)}"
         )
+    
+    return _build_provider(
+        provider,
+        kwargs.get("api_key") or settings.openai_api_key,
+        kwargs.get("model") or settings.openai_model,
+        kwargs.get("temperature", 0.7),
+        kwargs.get("max_tokens", 500)
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_provider(
+    provider: str,
+    api_key: Optional[str],
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int
+) -> LLMPort:
+    """Build a provider instance; memoized on the fully resolved configuration."""
+    return _PROVIDERS[provider](
+        api_key=api_key,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
 
+def clear_llm_provider_cache() -> None:
+    """Discard memoized provider instances (useful for testing)."""
+    _build_provider.cache_clear()
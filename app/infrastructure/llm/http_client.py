@@ -0,0 +1,47 @@
+"""Shared HTTP client for LLM provider SDKs.
+
+Every OpenAIProvider instance hands this client to the OpenAI SDK, so all of
+them share one connection pool and keep-alive connections (and their TLS
+sessions) are reused across providers and requests. When the h2 package is
+installed (httpx[http2]), concurrent calls are multiplexed over HTTP/2.
+"""
+import importlib.util
+from typing import Optional
+import httpx
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Global HTTP client instance
+_llm_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used to call LLM provider APIs.
+
+    Returns:
+        httpx.AsyncClient instance (created on first use).
+    """
+    global _llm_http_client
+
+    if _llm_http_client is None or _llm_http_client.is_closed:
+        _llm_http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0
+            )
+        )
+
+    return _llm_http_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared LLM HTTP client (for shutdown)."""
+    global _llm_http_client
+    if _llm_http_client:
+        await _llm_http_client.aclose()
+        _llm_http_client = None
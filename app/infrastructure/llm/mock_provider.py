@@ -1,7 +1,10 @@
 """Mock LLM provider implementation for testing and development."""
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Sequence
 from app.domain.ports.llm_port import LLMPort
+from app.domain.value_objects.message import Message
+
+_PREFIX = "Echo: "
 
 
 class MockProvider(LLMPort):
@@ -14,31 +17,54 @@ class MockProvider(LLMPort):
     - CI/CD pipelines where real LLM APIs are not available
     """
     
-    async def generate(self, message: str) -> str:
+    def __init__(self, simulate_latency: bool = False, chunk_delay: float = 0.05):
+        """
+        Initialize the mock provider.
+        
+        Args:
+            simulate_latency: If True, sleep between streamed chunks to mimic
+                              a real provider (useful for manual UI testing).
+            chunk_delay: Delay in seconds between chunks when simulating latency.
+        """
+        self.simulate_latency = simulate_latency
+        self.chunk_delay = chunk_delay
+    
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
         """
         Generate a mock response by echoing the input message.
         
         Args:
             message: The input message.
+            history: Earlier conversation messages (ignored).
             
         Returns:
             A formatted echo response.
         """
-        return f"Echo: {message}"
+        return _PREFIX + message
     
-    async def generate_stream(self, message: str) -> AsyncGenerator[str, None]:
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming mock response.
         
         Args:
             message: The input message.
+            history: Earlier conversation messages (ignored).
             
         Yields:
             Chunks of the echo response.
         """
-        response = f"Echo: {message}"
+        response = _PREFIX + message
         chunk_size = 5
         for i in range(0, len(response), chunk_size):
             yield response[i:i + chunk_size]
-            await asyncio.sleep(0.05)  # Small delay to simulate streaming
+            if self.simulate_latency:
+                await asyncio.sleep(self.chunk_delay)
 
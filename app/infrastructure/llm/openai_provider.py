@@ -1,17 +1,49 @@
 """OpenAI LLM provider implementation."""
+import asyncio
+import logging
+import operator
 import os
 import time
-from typing import Optional, AsyncGenerator, List
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Sequence, Union
 from app.domain.ports.llm_port import LLMPort
+from app.domain.value_objects.message import Message
 from app.domain.exceptions import LLMError
 from app.infrastructure.config.settings import settings
+from app.infrastructure.llm.http_client import get_llm_http_client
+
+# The SDK is imported with the module (which the factory only loads when the
+# openai provider is configured), so the first request doesn't pay for it
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
 
 # OpenTelemetry tracing
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
+logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Attributes that hold the generated text, in order of preference
+_TEXT_ATTRIBUTES = ("output_text", "output", "text")
+
+
+# System prompt frame sent first in every chat request. Shared, never mutated.
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful assistant."}
+
+
+def _get_text_from_dict(response: dict) -> Any:
+    """Read the generated text from a dict-shaped response."""
+    return response.get('output_text') or response.get('output') or response.get('text')
+
+
+def _to_api_messages(history: Sequence[Message], message: str) -> List[dict]:
+    """Convert earlier turns plus the new prompt to role/content API items."""
+    items = [{"role": m.role, "content": m.content} for m in history]
+    items.append({"role": "user", "content": message})
+    return items
+
 
 class OpenAIProvider(LLMPort):
     """
@@ -25,6 +57,12 @@ class OpenAIProvider(LLMPort):
     Implements automatic fallback chain for resilience.
     """
     
+    # Maximum number of earlier conversation messages sent with each prompt
+    MAX_HISTORY = 50
+    
+    # Response type -> function reading its text (None if no known attribute)
+    _text_getters: Dict[type, Optional[Callable[[Any], Any]]] = {}
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -51,10 +89,13 @@ class OpenAIProvider(LLMPort):
             )
         self.model = model
         self.temperature = temperature
+        # The model never changes after construction, so its family is resolved once
+        self._is_gpt5 = model.startswith("gpt-5")
+        self._is_o1 = model.startswith("o1")
         
         # For gpt-5 models, use lower default max_tokens to maintain coherence
         # GPT-5 Nano requires explicit max_output_tokens and works better with shorter responses
-        if model.startswith("gpt-5"):
+        if self._is_gpt5:
             # GPT-5 Nano works better with shorter responses (~200-600 tokens)
             # But ensure minimum of 50 tokens to avoid empty responses
             if max_tokens == 500:  # Default value, override it
@@ -82,6 +123,12 @@ class OpenAIProvider(LLMPort):
         self.circuit_breaker_opened_at: dict[str, float] = {}  # model -> timestamp when opened
         
         self._client = None
+        self._http_client = None
+        self._completion_params_by_model: dict[str, dict] = {}
+        self._completion_params = self._get_completion_params()
+        self._warmed_up = False
+        # Bounds how many requests of one batch are in flight at once
+        self._batch_semaphore = asyncio.Semaphore(settings.llm_batch_max_concurrency)
     
     def _get_fallback_chain(self, primary_model: str) -> List[str]:
         """
@@ -136,8 +183,6 @@ class OpenAIProvider(LLMPort):
         if model in self.circuit_breaker_opened_at:
             opened_at = self.circuit_breaker_opened_at[model]
             if time.time() - opened_at < self.circuit_breaker_recovery_timeout:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(
                     f"Circuit breaker OPEN for {model} "
                     f"(opened {int(time.time() - opened_at)}s ago, "
@@ -160,8 +205,6 @@ class OpenAIProvider(LLMPort):
         self.circuit_breaker_failures[model] = self.circuit_breaker_failures.get(model, 0) + 1
         
         if self.circuit_breaker_failures[model] >= self.circuit_breaker_failure_threshold:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(
                 f"Circuit breaker OPENED for {model} "
                 f"(failure count: {self.circuit_breaker_failures[model]})"
@@ -176,8 +219,6 @@ class OpenAIProvider(LLMPort):
         if model in self.circuit_breaker_failures:
             self.circuit_breaker_failures[model] = 0
         if model in self.circuit_breaker_opened_at:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"Circuit breaker CLOSED for {model} (successful call)")
             self.circuit_breaker_opened_at.pop(model, None)
     
@@ -202,8 +243,6 @@ class OpenAIProvider(LLMPort):
         if model in self.failed_models:
             last_failure = self.failed_models[model]
             if time.time() - last_failure < self.failure_cooldown:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.info(f"Skipping model {model} (failed recently, cooldown active)")
                 return True
         
@@ -220,31 +259,112 @@ class OpenAIProvider(LLMPort):
         self._record_circuit_breaker_failure(model)
     
     def _get_client(self):
-        """Lazy initialization of OpenAI client."""
-        if self._client is None:
-            try:
-                from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.api_key)
-            except ImportError:
+        """Lazy initialization of OpenAI client (on the shared HTTP connection pool)."""
+        # Rebuild if the shared HTTP client was closed (e.g. after a shutdown)
+        if self._client is None or self._http_client.is_closed:
+            if AsyncOpenAI is None:
                 raise ImportError(
                     "openai package is required. Install it with: pip install openai"
                 )
+            self._http_client = get_llm_http_client()
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self._http_client
+            )
         return self._client
     
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection to the OpenAI API before the first request.
+        
+        Sends a HEAD request to the API base URL (no tokens are used) so the
+        TCP/TLS handshake is done by the time generate is called. Only the
+        first call does anything; later requests reuse the kept-alive pool.
+        Failures are ignored, the real request will simply connect itself.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        
+        try:
+            client = self._get_client()
+            await self._http_client.head(str(client.base_url), timeout=5.0)
+        except Exception as e:
+            logger.debug(f"OpenAI connection warmup failed: {e}")
+    
+    async def embed(self, text: str) -> List[float]:
+        """
+        Get the embedding of a text (used by the semantic response cache).
+        
+        Args:
+            text: The text to embed.
+            
+        Returns:
+            The embedding vector.
+        """
+        client = self._get_client()
+        response = await client.embeddings.create(
+            model=settings.llm_embedding_model,
+            input=text
+        )
+        return response.data[0].embedding
+    
+    def _trim_history(self, history: Optional[Sequence[Message]]) -> Sequence[Message]:
+        """
+        Keep only the most recent MAX_HISTORY messages of a conversation.
+        
+        Older messages are dropped from the front, so the system prompt (which
+        is added separately) is always kept.
+        """
+        if not history:
+            return ()
+        return history[-self.MAX_HISTORY:]
+    
+    def _build_chat_messages(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> List[dict]:
+        """
+        Build the chat.completions messages list for a prompt.
+        
+        The system prompt comes first and earlier turns keep their order, so
+        consecutive requests in a conversation share the same prefix and can
+        hit OpenAI's prompt cache.
+        """
+        return [_SYSTEM_MESSAGE, *_to_api_messages(self._trim_history(history), message)]
+    
+    def _build_responses_input(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ):
+        """
+        Build the responses API input for a prompt.
+        
+        Without history the plain prompt string is sent, as before. With
+        history the earlier turns are sent as role/content items.
+        """
+        trimmed = self._trim_history(history)
+        if not trimmed:
+            return message
+        return _to_api_messages(trimmed, message)
+    
     def _get_completion_params(self):
         """
         Get the correct parameters for API call based on model.
         
         Legacy models (gpt-3.5, gpt-4) use max_tokens and temperature.
         Newer models (gpt-5-*) use max_output_tokens and don't support temperature.
+        Called once from __init__; request paths use self._completion_params.
         """
         params = {}
         
-        if self.model.startswith("gpt-5"):
+        if self._is_gpt5:
             # GPT-5 models use max_output_tokens (not max_tokens!)
             params["max_output_tokens"] = self.max_tokens
             # GPT-5 models only support default temperature, don't send it
-        elif self.model.startswith("o1"):
+        elif self._is_o1:
             # o1 models use max_tokens and don't support temperature
             params["max_tokens"] = self.max_tokens
         else:
@@ -254,6 +374,32 @@ class OpenAIProvider(LLMPort):
         
         return params
     
+    @classmethod
+    def _get_text_getter(cls, response) -> Optional[Callable[[Any], Any]]:
+        """
+        Get the function that reads the text of a response, by response type.
+        
+        The attribute probing runs once per response type; later responses
+        of the same type go straight to the attribute.
+        """
+        response_type = type(response)
+        try:
+            return cls._text_getters[response_type]
+        except KeyError:
+            pass
+        
+        getter = None
+        for attr_name in _TEXT_ATTRIBUTES:
+            if hasattr(response, attr_name):
+                getter = operator.attrgetter(attr_name)
+                break
+        else:
+            if isinstance(response, dict):
+                getter = _get_text_from_dict
+        
+        cls._text_getters[response_type] = getter
+        return getter
+    
     def _extract_text_from_response(self, response, logger=None) -> str:
         """
         Extract text from OpenAI response object, handling different response formats.
@@ -265,32 +411,27 @@ class OpenAIProvider(LLMPort):
         Returns:
             The extracted text as a string, or empty string if not found.
         """
-        if logger:
-            logger.debug(f"Extracting text from response: type={type(response)}")
+        # Only build the diagnostic strings below when they will be emitted
+        debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Extracting text from response: type=%s", type(response))
             if hasattr(response, '__dict__'):
-                logger.debug(f"Response attributes: {list(response.__dict__.keys())}")
+                logger.debug("Response attributes: %s", list(response.__dict__.keys()))
             elif isinstance(response, dict):
-                logger.debug(f"Response dict keys: {list(response.keys())}")
+                logger.debug("Response dict keys: %s", list(response.keys()))
         
         output_text = None
         
-        # Try different ways to get the output text
-        if hasattr(response, 'output_text'):
-            output_text = response.output_text
-            if logger:
-                logger.debug(f"Found output_text attribute: {type(output_text)}, value={repr(output_text)[:100]}")
-        elif hasattr(response, 'output'):
-            output_text = response.output
-            if logger:
-                logger.debug(f"Found output attribute: {type(output_text)}, value={repr(output_text)[:100]}")
-        elif hasattr(response, 'text'):
-            output_text = response.text
-            if logger:
-                logger.debug(f"Found text attribute: {type(output_text)}, value={repr(output_text)[:100]}")
-        elif isinstance(response, dict):
-            output_text = response.get('output_text') or response.get('output') or response.get('text')
-            if logger:
-                logger.debug(f"Found in dict: {type(output_text)}, value={repr(output_text)[:100] if output_text else None}")
+        # Read the text through the getter resolved for this response type
+        getter = self._get_text_getter(response)
+        if getter is not None:
+            try:
+                output_text = getter(response)
+            except AttributeError:
+                # This instance lacks the attribute its type usually has
+                output_text = None
+            if debug:
+                logger.debug("Found text: %s, value=%s", type(output_text), repr(output_text)[:100])
         
         # Try additional attributes that might contain the text
         if output_text is None or (isinstance(output_text, str) and not output_text.strip()):
@@ -298,8 +439,8 @@ class OpenAIProvider(LLMPort):
             for attr_name in ['content', 'message', 'response', 'result', 'data']:
                 if hasattr(response, attr_name):
                     attr_value = getattr(response, attr_name)
-                    if logger:
-                        logger.debug(f"Trying attribute {attr_name}: {type(attr_value)}")
+                    if debug:
+                        logger.debug("Trying attribute %s: %s", attr_name, type(attr_value))
                     if attr_value:
                         # If it's a dict/object, try to get text from it
                         if isinstance(attr_value, dict):
@@ -326,26 +467,31 @@ class OpenAIProvider(LLMPort):
         elif isinstance(output_text, list):
             # If it's a list, join the elements (assuming they're strings or can be converted)
             result = " ".join(str(item) for item in output_text if item)
-            if logger:
-                logger.debug(f"Joined list to string: {len(result)} chars")
+            if debug:
+                logger.debug("Joined list to string: %d chars", len(result))
             return result
         elif isinstance(output_text, str):
-            if logger:
-                logger.debug(f"Extracted string: {len(output_text)} chars")
+            if debug:
+                logger.debug("Extracted string: %d chars", len(output_text))
             return output_text
         else:
             # Convert to string as fallback
             result = str(output_text)
-            if logger:
-                logger.debug(f"Converted to string: {len(result)} chars")
+            if debug:
+                logger.debug("Converted to string: %d chars", len(result))
             return result
     
-    async def generate(self, message: str) -> str:
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
         """
         Generate a response using OpenAI API.
         
         Args:
             message: The input message/prompt.
+            history: Optional earlier messages of the conversation, oldest first.
             
         Returns:
             The generated response from OpenAI.
@@ -363,37 +509,27 @@ class OpenAIProvider(LLMPort):
             
             try:
                 # GPT-5 models use responses API, not chat.completions
-                if self.model.startswith("gpt-5"):
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    
-                    max_tokens_for_model = self._get_max_tokens_for_model(self.model)
+                if self._is_gpt5:
                     span.set_attribute("llm.api", "responses")
-                    span.set_attribute("llm.max_output_tokens", max_tokens_for_model)
-                    logger.debug(f"Using max_output_tokens={max_tokens_for_model} for {self.model}")
+                    span.set_attribute("llm.max_output_tokens", self.max_tokens)
+                    logger.debug("Using max_output_tokens=%d for %s", self.max_tokens, self.model)
                     
                     with tracer.start_as_current_span("openai.responses.create") as api_span:
                         api_span.set_attribute("openai.model", self.model)
                         response = await client.responses.create(
                             model=self.model,
-                            input=message,
-                            max_output_tokens=max_tokens_for_model
+                            input=self._build_responses_input(message, history),
+                            **self._completion_params
                         )
                     
-                    # Debug: Log response structure
-                    logger.info(f"Response from {self.model}: type={type(response)}, dir={dir(response)}")
-                    if hasattr(response, '__dict__'):
-                        logger.info(f"Response attributes: {response.__dict__}")
-                    
                     # Extract and normalize text from response
                     output_text = self._extract_text_from_response(response, logger)
                     span.set_attribute("llm.output_length", len(output_text))
-                    logger.info(f"Extracted output_text: {repr(output_text)}")
+                    logger.debug("Extracted output_text: %r", output_text)
                     return output_text
                 
                 # Legacy models (gpt-3.5, gpt-4) use chat.completions
                 span.set_attribute("llm.api", "chat.completions")
-                completion_params = self._get_completion_params()
                 span.set_attribute("llm.max_tokens", self.max_tokens)
                 span.set_attribute("llm.temperature", self.temperature)
                 
@@ -401,11 +537,8 @@ class OpenAIProvider(LLMPort):
                     api_span.set_attribute("openai.model", self.model)
                     response = await client.chat.completions.create(
                         model=self.model,
-                        messages=[
-                            {"role": "system", "content": "You are a helpful assistant."},
-                            {"role": "user", "content": message}
-                        ],
-                        **completion_params
+                        messages=self._build_chat_messages(message, history),
+                        **self._completion_params
                     )
                 
                 output_text = response.choices[0].message.content or ""
@@ -417,7 +550,47 @@ class OpenAIProvider(LLMPort):
                 span.set_status(Status(StatusCode.ERROR, str(e)))
                 raise RuntimeError(f"OpenAI API error: {str(e)}") from e
     
-    async def _try_stream_with_model(self, model: str, message: str, client) -> AsyncGenerator[str, None]:
+    async def generate_batch(
+        self,
+        messages: List[str],
+        histories: Optional[List[Optional[Sequence[Message]]]] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Generate responses for several messages concurrently.
+        
+        The chat API has no multi-prompt call, so each message is its own
+        request. They run concurrently over the shared connection pool, with
+        at most LLM_BATCH_MAX_CONCURRENCY in flight so a large batch does not
+        burst past the API rate limits. A failed request does not fail the
+        rest of the batch.
+        
+        Args:
+            messages: The input messages/prompts to send to the LLM.
+            histories: Optional per-message conversation history.
+            
+        Returns:
+            One entry per message, in the same order: the generated response,
+            or the exception raised while generating it.
+        """
+        if histories is None:
+            histories = [None] * len(messages)
+        
+        async def generate_one(message: str, history: Optional[Sequence[Message]]) -> str:
+            async with self._batch_semaphore:
+                return await self.generate(message, history=history)
+        
+        return list(await asyncio.gather(
+            *(generate_one(m, h) for m, h in zip(messages, histories)),
+            return_exceptions=True
+        ))
+    
+    async def _try_stream_with_model(
+        self,
+        model: str,
+        message: str,
+        client,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Try to stream with a specific model.
         
@@ -425,6 +598,7 @@ class OpenAIProvider(LLMPort):
             model: The model to try.
             message: The input message.
             client: The OpenAI client.
+            history: Optional earlier messages of the conversation.
             
         Yields:
             Chunks if successful.
@@ -432,15 +606,12 @@ class OpenAIProvider(LLMPort):
         Raises:
             RuntimeError: If streaming fails or returns no chunks.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if model.startswith("gpt-5"):
             # GPT-5 models use responses API
             chunks_yielded = 0
             async with client.responses.stream(
                 model=model,
-                input=message,
+                input=self._build_responses_input(message, history),
                 max_output_tokens=self.max_tokens
             ) as stream:
                 async for event in stream:
@@ -452,16 +623,13 @@ class OpenAIProvider(LLMPort):
             if chunks_yielded == 0:
                 raise RuntimeError(f"{model} returned stream with no chunks")
             
-            logger.info(f"Streaming successful with {model}: {chunks_yielded} chunks")
+            logger.debug("Streaming successful with %s: %d chunks", model, chunks_yielded)
         else:
             # Legacy models use chat.completions
             completion_params = self._get_completion_params_for_model(model)
             stream = await client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": message}
-                ],
+                messages=self._build_chat_messages(message, history),
                 stream=True,
                 **completion_params
             )
@@ -480,7 +648,7 @@ class OpenAIProvider(LLMPort):
             if chunks_yielded == 0:
                 raise RuntimeError(f"{model} returned stream with no chunks")
             
-            logger.info(f"Streaming successful with legacy model {model}: {chunks_yielded} chunks")
+            logger.debug("Streaming successful with legacy model %s: %d chunks", model, chunks_yielded)
     
     def _get_max_tokens_for_model(self, model: str) -> int:
         """
@@ -497,7 +665,17 @@ class OpenAIProvider(LLMPort):
             return self.max_tokens
     
     def _get_completion_params_for_model(self, model: str) -> dict:
-        """Get completion params for a specific model (not necessarily self.model)."""
+        """
+        Get completion params for a specific model (not necessarily self.model).
+        
+        The params only depend on the model name and settings fixed at
+        construction, so they are resolved once per model and reused. Callers
+        unpack the returned dict and must not mutate it.
+        """
+        params = self._completion_params_by_model.get(model)
+        if params is not None:
+            return params
+        
         params = {}
         max_tokens_for_model = self._get_max_tokens_for_model(model)
         
@@ -509,6 +687,7 @@ class OpenAIProvider(LLMPort):
             params["max_tokens"] = max_tokens_for_model
             params["temperature"] = self.temperature
         
+        self._completion_params_by_model[model] = params
         return params
     
     async def _generate_and_simulate_stream(
@@ -516,97 +695,85 @@ class OpenAIProvider(LLMPort):
         model: str,
         message: str,
         client,
-        chunk_size: int = 20,
-        sleep_time: float = 0.005
+        history: Optional[Sequence[Message]] = None
     ) -> AsyncGenerator[str, None]:
         """
-        Generate full response and simulate streaming quickly.
+        Generate the full response and yield it as a single chunk.
         
-        Used as fallback when native streaming fails.
-        Optimized for speed with larger chunks and minimal sleep.
+        Used as fallback when native streaming fails. The response is already
+        complete, so it is sent at once rather than paced out in small
+        chunks (the SSE layer frames it for the client).
         
         Args:
             model: The model to use.
             message: The input message.
             client: The OpenAI client.
-            chunk_size: Size of chunks for simulated streaming (default: 20).
-            sleep_time: Sleep time between chunks in seconds (default: 0.005).
+            history: Optional earlier messages of the conversation.
         """
-        import logging
-        import asyncio
-        logger = logging.getLogger(__name__)
-        
         if model.startswith("gpt-5"):
-            if logger:
-                logger.debug(f"Calling responses.create for {model} with input length: {len(message)}")
+            logger.debug("Calling responses.create for %s with input length: %d", model, len(message))
             
             try:
                 max_tokens_for_model = self._get_max_tokens_for_model(model)
-                if logger:
-                    logger.debug(f"Using max_output_tokens={max_tokens_for_model} for {model}")
+                logger.debug("Using max_output_tokens=%d for %s", max_tokens_for_model, model)
                 
                 response = await client.responses.create(
                     model=model,
-                    input=message,
+                    input=self._build_responses_input(message, history),
                     max_output_tokens=max_tokens_for_model
                 )
                 
-                if logger:
-                    logger.debug(f"Response received: type={type(response)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response received: type=%s", type(response))
                     if hasattr(response, '__dict__'):
-                        logger.debug(f"Response keys: {list(response.__dict__.keys())}")
+                        logger.debug("Response keys: %s", list(response.__dict__.keys()))
                 
                 # Extract and normalize text from response
                 full_response = self._extract_text_from_response(response, logger)
                 
-                if logger:
-                    logger.debug(f"Extracted response length: {len(full_response)} chars")
+                logger.debug("Extracted response length: %d chars", len(full_response))
             except Exception as e:
-                if logger:
-                    logger.error(f"Error calling responses.create for {model}: {e}")
+                logger.error("Error calling responses.create for %s: %s", model, e)
                 raise
         else:
             # Legacy models
             completion_params = self._get_completion_params_for_model(model)
             response = await client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": message}
-                ],
+                messages=self._build_chat_messages(message, history),
                 **completion_params
             )
             full_response = response.choices[0].message.content or ""
         
         if not full_response:
             # Log detailed information about the empty response
-            if logger:
-                logger.warning(
-                    f"{model} returned empty response. "
-                    f"Response type: {type(response)}, "
-                    f"Response attributes: {dir(response) if hasattr(response, '__dict__') else 'N/A'}"
-                )
+            logger.warning(
+                "%s returned empty response. Response type: %s",
+                model, type(response).__name__
+            )
             raise RuntimeError(f"{model} returned empty response")
         
-        # Simulate streaming with optimized chunk size and sleep time
-        for i in range(0, len(full_response), chunk_size):
-            yield full_response[i:i + chunk_size]
-            await asyncio.sleep(sleep_time)
+        yield full_response
         
-        logger.info(f"Simulated streaming completed with {model}: {len(full_response)} characters")
+        logger.debug("Simulated streaming completed with %s: %d characters", model, len(full_response))
     
-    async def generate_stream(self, message: str) -> AsyncGenerator[str, None]:
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming response using OpenAI API with optimized fallback.
         
         Optimizations:
         - Skip models that failed recently (cooldown)
         - Use minimal fallback chain (primary + one fallback)
-        - Simulate streaming with larger chunks and minimal sleep
+        - Fall back to a non-streaming call, sent as one chunk
         - Log and cache failures efficiently
         
         Args:
             message: The input message/prompt.
+            history: Optional earlier messages of the conversation, oldest first.
             
         Yields:
             Chunks of the generated response as they become available.
@@ -615,13 +782,12 @@ class OpenAIProvider(LLMPort):
             Exception: If all models in the optimized fallback chain fail.
         """
         client = self._get_client()
-        import logging
-        import asyncio
-        logger = logging.getLogger(__name__)
         
         if not self.fallback_enabled:
             # Fallback disabled, just try primary model
-            async for chunk in self._try_stream_with_model(self.model, message, client):
+            async for chunk in self._try_stream_with_model(
+                self.model, message, client, history=history
+            ):
                 yield chunk
             return
         
@@ -635,13 +801,13 @@ class OpenAIProvider(LLMPort):
                 optimized_chain.append(fallback_model)
         
         # Ensure we have at least gpt-4 and gpt-3.5-turbo as final fallbacks for GPT-5 models
-        if "gpt-5" in self.model:
+        if self._is_gpt5:
             if "gpt-4" not in optimized_chain:
                 optimized_chain.append("gpt-4")
             if "gpt-3.5-turbo" not in optimized_chain:
                 optimized_chain.append("gpt-3.5-turbo")
         
-        logger.info(f"Fallback chain: {optimized_chain}")
+        logger.debug("Fallback chain: %s", optimized_chain)
         last_error = None
         
         for model in optimized_chain:
@@ -650,11 +816,13 @@ class OpenAIProvider(LLMPort):
                 continue
             
             try:
-                logger.info(f"Attempting streaming with model: {model}")
+                logger.debug("Attempting streaming with model: %s", model)
                 
                 # Try native streaming first
                 try:
-                    async for chunk in self._try_stream_with_model(model, message, client):
+                    async for chunk in self._try_stream_with_model(
+                        model, message, client, history=history
+                    ):
                         yield chunk
                     # Success, clear failure cache and circuit breaker
                     self.failed_models.pop(model, None)
@@ -668,9 +836,8 @@ class OpenAIProvider(LLMPort):
                     
                     # Fast simulated streaming fallback
                     try:
-                        # Use larger chunks and minimal sleep for speed
                         async for chunk in self._generate_and_simulate_stream(
-                            model, message, client, chunk_size=20, sleep_time=0.005
+                            model, message, client, history=history
                         ):
                             yield chunk
                         # Success, clear failure cache and circuit breaker
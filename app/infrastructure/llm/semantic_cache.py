@@ -0,0 +1,209 @@
+"""Semantic response cache for LLM providers.
+
+The exact-match cache (see caching_provider) misses paraphrased prompts such
+as "Explain quantum computing" and "Break down quantum computing". This module
+embeds each prompt and serves the cached answer of a previous prompt whose
+embedding is close enough (cosine similarity above a threshold).
+
+Requires numpy, which is an optional dependency (pip install numpy).
+"""
+import logging
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional, Sequence
+from app.domain.ports.llm_port import LLMPort
+from app.domain.value_objects.message import Message
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Bounded store of prompt embeddings and their responses.
+
+    Embeddings are L2-normalized and kept in one preallocated matrix, so a
+    lookup is a single matrix-vector product over all entries. When full,
+    the oldest entry is overwritten (FIFO ring buffer).
+    """
+
+    def __init__(self, max_entries: int = 5000, threshold: float = 0.95):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of prompts kept.
+            threshold: Minimum cosine similarity for a cached response to be served.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "numpy package is required for the semantic cache. Install it with: pip install numpy"
+            )
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._np = numpy
+        self.max_entries = max_entries
+        self.threshold = threshold
+        # Allocated on the first add, once the embedding dimension is known
+        self._embeddings = None
+        self._responses: List[Optional[str]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+
+    def _normalize(self, embedding: Sequence[float]):
+        """Return the embedding as a unit-length float32 vector."""
+        vector = self._np.asarray(embedding, dtype=self._np.float32)
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: Sequence[float]) -> Optional[str]:
+        """
+        Find the response of the most similar cached prompt.
+
+        Args:
+            embedding: Embedding of the incoming prompt.
+
+        Returns:
+            The cached response if its prompt is similar enough, None otherwise.
+        """
+        if self._size == 0:
+            return None
+
+        query = self._normalize(embedding)
+        if query.shape[0] != self._embeddings.shape[1]:
+            return None
+
+        scores = self._embeddings[:self._size] @ query
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            return self._responses[best]
+        return None
+
+    def add(self, embedding: Sequence[float], response: str) -> None:
+        """
+        Store a prompt embedding and its response, evicting the oldest if full.
+
+        Args:
+            embedding: Embedding of the prompt.
+            response: The response generated for the prompt.
+        """
+        vector = self._normalize(embedding)
+        if self._embeddings is None:
+            self._embeddings = self._np.zeros(
+                (self.max_entries, vector.shape[0]), dtype=self._np.float32
+            )
+        elif vector.shape[0] != self._embeddings.shape[1]:
+            logger.warning("Embedding dimension changed, not caching response")
+            return
+
+        self._embeddings[self._next] = vector
+        self._responses[self._next] = response
+        self._next = (self._next + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+
+class SemanticCachingLLMProvider(LLMPort):
+    """
+    LLMPort decorator that serves near-duplicate prompts from a SemanticCache.
+
+    Only prompts without conversation history are cached, since the same
+    question asked mid-conversation can need a different answer. Embedding
+    failures are never fatal: the underlying provider is called instead.
+    """
+
+    def __init__(
+        self,
+        provider: LLMPort,
+        embed: Callable[[str], Awaitable[List[float]]],
+        cache: SemanticCache
+    ):
+        """
+        Initialize the semantic caching provider.
+
+        Args:
+            provider: The LLM provider to delegate cache misses to.
+            embed: Async function returning the embedding of a prompt.
+            cache: Store of prompt embeddings and responses.
+        """
+        self.provider = provider
+        self.embed = embed
+        self.cache = cache
+
+    async def _embed(self, message: str) -> Optional[List[float]]:
+        """Embed a prompt, returning None (cache bypass) on error."""
+        try:
+            return await self.embed(message)
+        except Exception as e:
+            logger.warning(f"Prompt embedding failed, bypassing semantic cache: {e}")
+            return None
+
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
+        """
+        Generate a response, serving near-duplicate prompts from the cache.
+
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+
+        Returns:
+            The cached or freshly generated response.
+        """
+        if history:
+            return await self.provider.generate(message, history=history)
+
+        embedding = await self._embed(message)
+        if embedding is None:
+            return await self.provider.generate(message)
+
+        cached = self.cache.lookup(embedding)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate(message)
+        if response:
+            self.cache.add(embedding, response)
+        return response
+
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response, serving near-duplicate prompts from the cache.
+
+        On a hit the cached response is yielded as a single chunk.
+
+        Args:
+            message: The input message/prompt to send to the LLM.
+            history: Optional earlier messages of the conversation.
+
+        Yields:
+            String chunks of the response.
+        """
+        embedding = None if history else await self._embed(message)
+        if embedding is not None:
+            cached = self.cache.lookup(embedding)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = []
+        async for chunk in self.provider.generate_stream(message, history=history):
+            chunks.append(chunk)
+            yield chunk
+
+        if embedding is not None and chunks:
+            self.cache.add(embedding, "".join(chunks))
+
+    async def warmup(self) -> None:
+        """Warm up the wrapped provider."""
+        await self.provider.warmup()
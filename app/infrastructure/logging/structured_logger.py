@@ -1,6 +1,6 @@
 """Structured logger implementation using Python's logging module."""
 import logging
-import json
+import orjson
 import os
 import logging.handlers
 from pathlib import Path
@@ -30,7 +30,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data).decode()
 
 
 class StructuredLogger(LoggerPort):
@@ -145,7 +145,7 @@ class StructuredLogger(LoggerPort):
         }
         
         # Output as JSON for structured logging
-        self.logger.log(level, json.dumps(log_data))
+        self.logger.log(level, orjson.dumps(log_data).decode())
     
     def info(self, message: str, **kwargs: Any) -> None:
         """Log an info message."""
@@ -9,7 +9,7 @@ from datetime import datetime
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 
 from app.domain.entities.conversation import Conversation
 from app.domain.ports.repository_port import RepositoryPort
@@ -90,6 +90,13 @@ class PostgresRepository(RepositoryPort):
         """
         Save a conversation and its messages.
         
+        Messages are append-only, so only the messages added to this entity
+        since it was loaded or last saved (see persisted_message_count) are
+        inserted, in a single multi-row INSERT. The conversation row is locked
+        while the next sequence number is read, so concurrent saves of the
+        same conversation (e.g. from two stale copies) each append their own
+        messages instead of overwriting or dropping one another's.
+        
         Args:
             conversation: The conversation entity to save.
             
@@ -98,69 +105,70 @@ class PostgresRepository(RepositoryPort):
         """
         async with self.async_session() as session:
             try:
+                now = datetime.utcnow()
+                
                 if conversation.id:
-                    # Update existing conversation
+                    # Lock the conversation row until commit so concurrent
+                    # saves read the last sequence one after the other
                     result = await session.execute(
-                        select(ConversationModel).where(
-                            ConversationModel.id == conversation.id
-                        )
+                        select(ConversationModel.id)
+                        .where(ConversationModel.id == conversation.id)
+                        .with_for_update()
                     )
-                    conv_model = result.scalar_one_or_none()
-                    
-                    if conv_model is None:
+                    if result.scalar_one_or_none() is None:
                         raise RepositoryError(f"Conversation {conversation.id} not found")
                     
-                    # Update timestamps
-                    conv_model.updated_at = datetime.utcnow()
+                    await session.execute(
+                        update(ConversationModel)
+                        .where(ConversationModel.id == conversation.id)
+                        .values(updated_at=now)
+                    )
+                    
+                    # Last stored sequence, served from idx_messages_conversation_sequence
+                    result = await session.execute(
+                        select(func.coalesce(func.max(MessageModel.sequence), 0))
+                        .where(MessageModel.conversation_id == conversation.id)
+                    )
+                    last_sequence = result.scalar_one()
                 else:
                     # Create new conversation
                     conversation.id = str(uuid.uuid4())
-                    conv_model = ConversationModel(
+                    session.add(ConversationModel(
                         id=conversation.id,
                         user_id=conversation.user_id,
-                        created_at=conversation.created_at or datetime.utcnow(),
-                        updated_at=conversation.updated_at or datetime.utcnow()
-                    )
-                    session.add(conv_model)
+                        created_at=conversation.created_at or now,
+                        updated_at=conversation.updated_at or now
+                    ))
+                    # Flush so the conversation row exists before its messages
+                    await session.flush()
+                    last_sequence = 0
                 
-                # Get existing messages to avoid duplicates
-                result = await session.execute(
-                    select(MessageModel).where(
-                        MessageModel.conversation_id == conversation.id
-                    ).order_by(MessageModel.sequence.desc())
-                )
-                existing_messages = result.scalars().all()
-                existing_sequence = max([m.sequence for m in existing_messages], default=0)
-                next_sequence = existing_sequence + 1
-                
-                # Get existing message contents to check for duplicates
-                existing_contents = {(m.content, m.role, m.created_at) for m in existing_messages}
-                
-                # Save only new messages
-                for msg in conversation.messages:
-                    msg_key = (msg.content, msg.role, msg.timestamp or datetime.utcnow())
-                    
-                    # Skip if message already exists
-                    if msg_key in existing_contents:
-                        continue
-                    
-                    msg_model = MessageModel(
-                        id=str(uuid.uuid4()),
-                        conversation_id=conversation.id,
-                        content=msg.content,
-                        role=msg.role,
-                        created_at=msg.timestamp or datetime.utcnow(),
-                        sequence=next_sequence
+                # Save only the messages this entity has not persisted yet
+                new_messages = conversation.messages[conversation.persisted_message_count:]
+                if new_messages:
+                    await session.execute(
+                        insert(MessageModel),
+                        [
+                            {
+                                "id": str(uuid.uuid4()),
+                                "conversation_id": conversation.id,
+                                "content": msg.content,
+                                "role": msg.role,
+                                "created_at": msg.timestamp or now,
+                                "sequence": last_sequence + offset
+                            }
+                            for offset, msg in enumerate(new_messages, start=1)
+                        ]
                     )
-                    session.add(msg_model)
-                    next_sequence += 1
                 
                 await session.commit()
                 
+                conversation.persisted_message_count = len(conversation.messages)
+                
                 # Update conversation timestamps
-                conversation.updated_at = datetime.utcnow()
+                conversation.updated_at = now
                 if conversation.created_at is None:
-                    conversation.created_at = conv_model.created_at
+                    conversation.created_at = now
                 
                 return conversation
             except Exception as e:
@@ -263,7 +271,8 @@ class PostgresRepository(RepositoryPort):
             id=conv_model.id,
             messages=messages,
             created_at=conv_model.created_at,
-            updated_at=conv_model.updated_at
+            updated_at=conv_model.updated_at,
+            persisted_message_count=len(messages)
         )
         
         return conversation
@@ -1,12 +1,27 @@
 """Repository implementation for persistence."""
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Optional, List, Tuple
 from datetime import datetime
 import uuid
 from app.domain.entities.conversation import Conversation
 from app.domain.ports.repository_port import RepositoryPort
 from app.domain.exceptions import RepositoryError
 from app.domain.value_objects.message import Message
-from app.infrastructure.persistence.models import ConversationModel, Base
+
+
+@dataclass(frozen=True)
+class _ConversationSnapshot:
+    """
+    Immutable copy of a conversation as stored by InMemoryRepository.
+    
+    Message is a frozen value object, so the messages can be shared between
+    the snapshot and the entities built from it without copying each one.
+    """
+    id: str
+    user_id: str
+    messages: Tuple[Message, ...]
+    created_at: datetime
+    updated_at: datetime
 
 
 class InMemoryRepository(RepositoryPort):
@@ -18,7 +33,10 @@ class InMemoryRepository(RepositoryPort):
     
     def __init__(self):
         """Initialize the in-memory repository."""
-        self._storage: dict[str, ConversationModel] = {}
+        self._storage: dict[str, _ConversationSnapshot] = {}
+        # Secondary index: user_id -> conversation IDs (dict keys keep insertion
+        # order), so listing a user's conversations doesn't scan every one
+        self._ids_by_user: dict[str, dict[str, None]] = {}
     
     async def save(self, conversation: Conversation) -> Conversation:
         """
@@ -31,34 +49,29 @@ class InMemoryRepository(RepositoryPort):
             The saved conversation with generated ID if applicable.
         """
         try:
-            # Convert entity to model
             if conversation.id is None:
                 conversation.id = str(uuid.uuid4())
             
-            # Convert messages to dict format
-            messages_data = [
-                {
-                    "content": msg.content,
-                    "role": msg.role,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None
-                }
-                for msg in conversation.messages
-            ]
-            
-            model = ConversationModel(
+            now = datetime.now()
+            snapshot = _ConversationSnapshot(
                 id=conversation.id,
                 user_id=conversation.user_id,
-                messages=messages_data,
-                created_at=conversation.created_at or datetime.now(),
-                updated_at=conversation.updated_at or datetime.now()
+                messages=tuple(conversation.messages),
+                created_at=conversation.created_at or now,
+                updated_at=conversation.updated_at or now
             )
             
-            self._storage[conversation.id] = model
+            previous = self._storage.get(conversation.id)
+            if previous is not None and previous.user_id != conversation.user_id:
+                self._unindex(previous.user_id, conversation.id)
+            
+            self._storage[conversation.id] = snapshot
+            self._ids_by_user.setdefault(conversation.user_id, {})[conversation.id] = None
             
             # Update conversation timestamps
-            conversation.updated_at = datetime.now()
+            conversation.updated_at = now
             if conversation.created_at is None:
-                conversation.created_at = datetime.now()
+                conversation.created_at = now
             
             return conversation
         except Exception as e:
@@ -75,11 +88,11 @@ class InMemoryRepository(RepositoryPort):
             The conversation if found, None otherwise.
         """
         try:
-            model = self._storage.get(conversation_id)
-            if model is None:
+            snapshot = self._storage.get(conversation_id)
+            if snapshot is None:
                 return None
             
-            return self._model_to_entity(model)
+            return self._snapshot_to_entity(snapshot)
         except Exception as e:
             raise RepositoryError(f"Failed to find conversation: {str(e)}") from e
     
@@ -94,11 +107,8 @@ class InMemoryRepository(RepositoryPort):
             List of conversations for the user.
         """
         try:
-            models = [
-                model for model in self._storage.values()
-                if model.user_id == user_id
-            ]
-            return [self._model_to_entity(model) for model in models]
+            ids = self._ids_by_user.get(user_id, ())
+            return [self._snapshot_to_entity(self._storage[cid]) for cid in ids]
         except Exception as e:
             raise RepositoryError(f"Failed to find conversations: {str(e)}") from e
     
@@ -113,35 +123,31 @@ class InMemoryRepository(RepositoryPort):
             True if deleted, False if not found.
         """
         try:
-            if conversation_id in self._storage:
-                del self._storage[conversation_id]
-                return True
-            return False
+            snapshot = self._storage.pop(conversation_id, None)
+            if snapshot is None:
+                return False
+            self._unindex(snapshot.user_id, conversation_id)
+            return True
         except Exception as e:
             raise RepositoryError(f"Failed to delete conversation: {str(e)}") from e
     
-    def _model_to_entity(self, model: ConversationModel) -> Conversation:
-        """Convert a model to an entity."""
-        # Convert messages from dict to Message value objects
-        messages = [
-            Message(
-                content=msg_data["content"],
-                role=msg_data["role"],
-                timestamp=datetime.fromisoformat(msg_data["timestamp"])
-                if msg_data.get("timestamp") else None
-            )
-            for msg_data in model.messages
-        ]
-        
-        conversation = Conversation(
-            user_id=model.user_id,
-            id=model.id,
-            messages=messages,
-            created_at=model.created_at,
-            updated_at=model.updated_at
+    def _unindex(self, user_id: str, conversation_id: str) -> None:
+        """Remove a conversation ID from the user index."""
+        ids = self._ids_by_user.get(user_id)
+        if ids is not None:
+            ids.pop(conversation_id, None)
+            if not ids:
+                del self._ids_by_user[user_id]
+    
+    def _snapshot_to_entity(self, snapshot: _ConversationSnapshot) -> Conversation:
+        """Convert a stored snapshot to a new entity."""
+        return Conversation(
+            user_id=snapshot.user_id,
+            id=snapshot.id,
+            messages=list(snapshot.messages),
+            created_at=snapshot.created_at,
+            updated_at=snapshot.updated_at
         )
-        
-        return conversation
     
     async def check_health(self) -> bool:
         """
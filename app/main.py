@@ -1,4 +1,5 @@
 """Main application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.infrastructure.config.settings import settings
@@ -8,8 +9,12 @@ from app.api.routes import chat_stream_routes
 from app.api.routes import health_routes
 from app.api.routes import conversation_routes
 from app.api.middleware.correlation import CorrelationIDMiddleware
+from app.api.responses import ORJSONResponse
 from app.infrastructure.exceptions import ConfigurationError
 from app.infrastructure.cache.redis_client import close_cache_client
+from app.api.routes.auth_routes import close_auth_http_client
+from app.infrastructure.llm.http_client import close_llm_http_client
+from app.bootstrap import get_container
 import logging
 
 # OpenTelemetry imports
@@ -126,37 +131,51 @@ def setup_prometheus(app_instance: FastAPI):
         logger.error(f"Failed to configure Prometheus: {e}", exc_info=True)
 
 
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    debug=settings.debug
-)
-
-# Setup observability BEFORE adding routes
-setup_opentelemetry(app)
-setup_prometheus(app)
-
-# Validate configuration on startup
-@app.on_event("startup")
-async def startup_event():
-    """Validate configuration on application startup."""
+@asynccontextmanager
+async def lifespan(app_instance: FastAPI):
+    """
+    Run application startup and shutdown.
+    
+    On startup the configuration is validated, failing fast if it is
+    invalid, and the LLM provider is created so its SDK import and client
+    setup don't land on the first request. On shutdown shared clients and
+    connection pools are closed.
+    
+    Args:
+        app_instance: FastAPI application instance.
+    """
     try:
         validate_configuration()
         logger.info("Configuration validated successfully")
     except ConfigurationError as e:
         logger.error(f"Configuration validation failed: {e}")
         raise  # Fail fast if configuration is invalid
+    
+    get_container().get_llm()
+    
+    yield
+    
+    # Close each client on its own so one failure doesn't leak the others
+    for close in (close_cache_client, close_auth_http_client, close_llm_http_client):
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Error during shutdown ({close.__name__}): {e}")
+    logger.info("Application shutdown complete")
 
 
-# Cleanup on shutdown
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup resources on application shutdown."""
-    try:
-        await close_cache_client()
-        logger.info("Application shutdown complete")
-    except Exception as e:
-        logger.warning(f"Error during shutdown: {e}")
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    debug=settings.debug,
+    lifespan=lifespan,
+    # Render endpoints that return plain dicts with orjson instead of stdlib json
+    default_response_class=ORJSONResponse
+)
+
+# Setup observability BEFORE adding routes
+setup_opentelemetry(app)
+setup_prometheus(app)
 
 # Add CORS middleware (must be before other middlewares)
 # Security: Use specific methods and headers instead of wildcards
@@ -1,3 +1,4 @@
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -60,14 +61,14 @@ def test_token_with_user_id():
     return _create_token
 
 
-@pytest.fixture
-def mock_jwt_validator(monkeypatch):
+@pytest.fixture(scope="session")
+def mock_jwt_validator():
     """
     Mock JWT validator that accepts test tokens.
     
     This fixture overrides the JWT validator to accept tokens signed with
     the test secret key, allowing integration tests to work without a real
-    Keycloak instance.
+    Keycloak instance. The patch stays in place for the whole test session.
     """
     from app.infrastructure.auth.jwt_validator import JWTValidator, JWTValidationError
     
@@ -101,25 +102,31 @@ def mock_jwt_validator(monkeypatch):
     def get_test_validator():
         return TestJWTValidator()
     
-    # Monkey patch the validator
-    monkeypatch.setattr(
-        "app.infrastructure.auth.jwt_validator.get_jwt_validator",
-        get_test_validator
-    )
-    
-    # Also patch in dependencies module
-    monkeypatch.setattr(
-        "app.api.dependencies.get_jwt_validator",
-        get_test_validator
-    )
+    # The built-in monkeypatch fixture is function-scoped, so use a
+    # MonkeyPatch context that is undone at the end of the session
+    with pytest.MonkeyPatch.context() as mp:
+        # Monkey patch the validator
+        mp.setattr(
+            "app.infrastructure.auth.jwt_validator.get_jwt_validator",
+            get_test_validator
+        )
+        
+        # Also patch in dependencies module
+        mp.setattr(
+            "app.api.dependencies.get_jwt_validator",
+            get_test_validator
+        )
+        yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app(mock_jwt_validator):
     """
     Create a FastAPI app instance for testing.
     
     This fixture includes all routers and sets up the mock JWT validator.
+    It is built once per session, since route setup introspects every
+    Pydantic model and the routes are stateless.
     """
     test_app = FastAPI(title="AI Platform Test")
     test_app.include_router(chat_router, prefix=settings.api_prefix)
@@ -128,10 +135,11 @@ def app(mock_jwt_validator):
     return test_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared by the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -140,10 +148,25 @@ def authenticated_client(client, test_token):
     Create a test client with authentication headers pre-configured.
     
     This fixture provides a client that automatically includes the
-    Authorization header with a valid test token.
+    Authorization header with a valid test token. The header is removed
+    again afterwards, so it never leaks into tests using the shared client.
     """
     client.headers.update({
         "Authorization": f"Bearer {test_token}"
     })
-    return client
+    yield client
+    client.headers.pop("Authorization", None)
 
+
+@pytest.fixture
+async def aclient(app):
+    """
+    Create an async test client for the FastAPI app.
+    
+    Requests go through httpx's ASGI transport on the test's event loop,
+    so streaming responses (SSE) can be consumed chunk by chunk with
+    aclient.stream(...) instead of being drained by the sync TestClient.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
@@ -68,3 +68,31 @@ class TestLLMPortContract:
         result = await llm.generate("test")
         assert isinstance(result, str)
 
+    
+    @pytest.mark.parametrize("llm_class", [
+        FakeLLM,
+        MockProvider,
+    ])
+    @pytest.mark.asyncio
+    async def test_generate_batch_preserves_order(self, llm_class):
+        """Test that generate_batch returns one response per message, in order."""
+        llm = llm_class()
+        messages = ["first", "second", "third"]
+        
+        results = await llm.generate_batch(messages)
+        
+        assert len(results) == len(messages)
+        assert results == [await llm.generate(m) for m in messages]
+    
+    @pytest.mark.parametrize("llm_class", [
+        FakeLLM,
+        MockProvider,
+    ])
+    @pytest.mark.asyncio
+    async def test_warmup_is_safe_to_call(self, llm_class):
+        """Test that warmup can be awaited repeatedly before generating."""
+        llm = llm_class()
+        
+        assert await llm.warmup() is None
+        assert await llm.warmup() is None
+        assert isinstance(await llm.generate("hello"), str)
@@ -1,3 +1,4 @@
+import orjson
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -128,6 +129,30 @@ class TestMessageEndpoint:
         assert conv_id_1 != conv_id_2
 
 
+class TestMessageStreamEndpoint:
+    """Integration tests for POST /chat/message/stream endpoint."""
+
+    async def test_stream_message_sends_sse_events(self, aclient, test_token):
+        """Test that the streamed response arrives as SSE data events ending with done."""
+        events = []
+        async with aclient.stream(
+            "POST",
+            "/api/v1/chat/message/stream",
+            json={"message": "Hello, AI!"},
+            headers={"Authorization": f"Bearer {test_token}"}
+        ) as response:
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"].startswith("text/event-stream")
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    events.append(orjson.loads(line[len("data: "):]))
+        
+        assert events
+        assert events[-1]["done"] is True
+        assert "conversation_id" in events[-1]
+        assert "".join(e.get("chunk", "") for e in events[:-1])
+
+
 class TestHealthEndpoint:
     """Integration tests for GET /chat/health endpoint."""
 
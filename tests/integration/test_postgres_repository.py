@@ -0,0 +1,67 @@
+"""Integration tests for PostgresRepository.save against a real SQL engine.
+
+Runs the repository on a temporary SQLite database (via aiosqlite), which
+exercises the same SQLAlchemy statements without a PostgreSQL server. Row
+locking (SELECT ... FOR UPDATE) is a no-op on SQLite; the tests cover the
+append-only bookkeeping. Requires aiosqlite, which CI installs.
+"""
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from app.domain.entities.conversation import Conversation
+from app.domain.value_objects.message import Message
+from app.infrastructure.persistence.models_relational import Base
+from app.infrastructure.persistence.postgres_repository import PostgresRepository
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    """Create a repository on an empty SQLite database."""
+    repo = PostgresRepository(database_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with repo.engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield repo
+    await repo.engine.dispose()
+
+
+class TestPostgresRepositorySave:
+    """Integration tests for PostgresRepository.save."""
+
+    async def test_save_appends_only_new_messages(self, repository):
+        """Test that saving the same entity again stores only the messages added since."""
+        conversation = Conversation(user_id="user1")
+        conversation.add_message(Message(content="first", role="user"))
+        await repository.save(conversation)
+        
+        conversation.add_message(Message(content="reply", role="assistant"))
+        await repository.save(conversation)
+        
+        stored = await repository.find_by_id(conversation.id)
+        assert [m.content for m in stored.messages] == ["first", "reply"]
+
+    async def test_concurrent_saves_from_same_snapshot_keep_all_messages(self, repository):
+        """Test that two stale copies of a conversation both get their new messages stored."""
+        conversation = Conversation(user_id="user1")
+        conversation.add_message(Message(content="hello", role="user"))
+        await repository.save(conversation)
+        
+        # Two turns load the same snapshot, e.g. from two browser tabs
+        first_tab = await repository.find_by_id(conversation.id)
+        second_tab = await repository.find_by_id(conversation.id)
+        first_tab.add_exchange(
+            Message(content="question A", role="user"),
+            Message(content="answer A", role="assistant")
+        )
+        second_tab.add_exchange(
+            Message(content="question B", role="user"),
+            Message(content="answer B", role="assistant")
+        )
+        
+        await repository.save(first_tab)
+        await repository.save(second_tab)
+        
+        stored = await repository.find_by_id(conversation.id)
+        assert [m.content for m in stored.messages] == [
+            "hello", "question A", "answer A", "question B", "answer B"
+        ]
@@ -3,7 +3,8 @@
 These fakes implement the domain ports (Protocols) and are used in unit tests
 to ensure the application layer depends only on domain ports, not concrete implementations.
 """
-from typing import Optional, List, Dict, AsyncGenerator
+from typing import Optional, List, Dict, AsyncGenerator, Any, Sequence
+from app.domain.ports.cache_port import CachePort
 from app.domain.ports.llm_port import LLMPort
 from app.domain.ports.repository_port import RepositoryPort
 from app.domain.entities.conversation import Conversation
@@ -29,14 +30,20 @@ class FakeLLM(LLMPort):
         self.response = response
         self.should_raise = should_raise
         self.called_with: Optional[str] = None
+        self.called_with_history: Optional[List[Message]] = None
         self.call_count = 0
     
-    async def generate(self, message: str) -> str:
+    async def generate(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> str:
         """
         Generate a fake response.
         
         Args:
             message: The input message (stored for verification).
+            history: Earlier conversation messages (stored for verification).
             
         Returns:
             The configured fake response.
@@ -45,6 +52,7 @@ class FakeLLM(LLMPort):
             The configured exception if should_raise is set.
         """
         self.called_with = message
+        self.called_with_history = list(history) if history is not None else None
         self.call_count += 1
         
         if self.should_raise:
@@ -52,12 +60,17 @@ class FakeLLM(LLMPort):
         
         return self.response
     
-    async def generate_stream(self, message: str) -> AsyncGenerator[str, None]:
+    async def generate_stream(
+        self,
+        message: str,
+        history: Optional[Sequence[Message]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming fake response.
         
         Args:
             message: The input message.
+            history: Earlier conversation messages (stored for verification).
             
         Yields:
             Chunks of the fake response.
@@ -65,6 +78,7 @@ class FakeLLM(LLMPort):
         import asyncio
         
         self.called_with = message
+        self.called_with_history = list(history) if history is not None else None
         self.call_count += 1
         
         if self.should_raise:
@@ -159,3 +173,44 @@ class FakeRepository(RepositoryPort):
             return True
         return False
 
+
+class FakeCache(CachePort):
+    """
+    Fake cache implementation for unit testing.
+    
+    Stores values in a plain dict and ignores TTLs.
+    """
+    
+    def __init__(self):
+        """Initialize fake cache with empty storage."""
+        self._storage: Dict[str, Any] = {}
+        self.get_count = 0
+        self.set_count = 0
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from the fake cache."""
+        self.get_count += 1
+        return self._storage.get(key)
+    
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """Set a value in the fake cache."""
+        self.set_count += 1
+        self._storage[key] = value
+        return True
+    
+    async def delete(self, key: str) -> bool:
+        """Delete a key from the fake cache."""
+        return self._storage.pop(key, None) is not None
+    
+    async def increment(self, key: str, amount: int = 1, ttl_seconds: Optional[int] = None) -> int:
+        """Increment a numeric value in the fake cache."""
+        self._storage[key] = self._storage.get(key, 0) + amount
+        return self._storage[key]
+    
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in the fake cache."""
+        return key in self._storage
+    
+    async def close(self) -> None:
+        """Close the fake cache (no-op)."""
+        pass
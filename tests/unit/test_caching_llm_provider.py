@@ -0,0 +1,127 @@
+"""Unit tests for CachingLLMProvider using fakes."""
+import asyncio
+import pytest
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.llm.caching_provider import CachingLLMProvider
+from tests.unit.fakes import FakeCache, FakeLLM
+
+
+class SlowLLM(FakeLLM):
+    """FakeLLM whose generate takes a moment, so concurrent calls overlap."""
+    
+    async def generate(self, message, history=None):
+        await asyncio.sleep(0.01)
+        return await super().generate(message, history=history)
+
+
+class FailsFirstLLM(SlowLLM):
+    """SlowLLM whose first call fails, so the next waiter has to generate."""
+    
+    async def generate(self, message, history=None):
+        if self.call_count == 0:
+            self.call_count += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+        return await super().generate(message, history=history)
+
+
+class TestCachingLLMProvider:
+    """Unit tests for CachingLLMProvider."""
+
+    @pytest.mark.asyncio
+    async def test_generate_serves_repeated_prompt_from_cache(self):
+        """Test that an identical prompt only reaches the provider once."""
+        fake_llm = FakeLLM(response="cached answer")
+        provider = CachingLLMProvider(fake_llm, FakeCache(), namespace="mock:test")
+        
+        first = await provider.generate("hi")
+        second = await provider.generate("hi")
+        
+        assert first == second == "cached answer"
+        assert fake_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_keys_by_prompt_and_namespace(self):
+        """Test that different prompts or models do not share cache entries."""
+        fake_llm = FakeLLM(response="answer")
+        cache = FakeCache()
+        
+        await CachingLLMProvider(fake_llm, cache, namespace="mock:a").generate("hi")
+        await CachingLLMProvider(fake_llm, cache, namespace="mock:a").generate("bye")
+        await CachingLLMProvider(fake_llm, cache, namespace="mock:b").generate("hi")
+        
+        assert fake_llm.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_does_not_cache_errors(self):
+        """Test that provider errors propagate and are not cached."""
+        fake_llm = FakeLLM(should_raise=RuntimeError("boom"))
+        cache = FakeCache()
+        provider = CachingLLMProvider(fake_llm, cache, namespace="mock:test")
+        
+        with pytest.raises(RuntimeError):
+            await provider.generate("hi")
+        
+        assert cache.set_count == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_caches_assembled_response(self):
+        """Test that a completed stream is cached and replayed on the next call."""
+        fake_llm = FakeLLM(response="streamed answer")
+        provider = CachingLLMProvider(fake_llm, FakeCache(), namespace="mock:test")
+        
+        first = [chunk async for chunk in provider.generate_stream("hi")]
+        second = [chunk async for chunk in provider.generate_stream("hi")]
+        
+        assert "".join(first) == "streamed answer"
+        assert second == ["streamed answer"]
+        assert fake_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_share_one_call(self):
+        """Test that concurrent misses for the same prompt reach the provider once."""
+        slow_llm = SlowLLM(response="answer")
+        provider = CachingLLMProvider(slow_llm, FakeCache(), namespace="mock:test")
+        
+        results = await asyncio.gather(*(provider.generate("hi") for _ in range(5)))
+        
+        assert results == ["answer"] * 5
+        assert slow_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prompt_lock_is_kept_while_callers_wait(self):
+        """Test that a caller arriving while others still wait joins the same lock."""
+        flaky_llm = FailsFirstLLM(response="answer")
+        provider = CachingLLMProvider(flaky_llm, FakeCache(), namespace="mock:test")
+        
+        async def late_caller():
+            # Arrives after the first call failed, while the waiter regenerates
+            await asyncio.sleep(0.015)
+            return await provider.generate("hi")
+        
+        results = await asyncio.gather(
+            provider.generate("hi"),
+            provider.generate("hi"),
+            late_caller(),
+            return_exceptions=True
+        )
+        
+        assert isinstance(results[0], RuntimeError)
+        assert results[1:] == ["answer", "answer"]
+        assert flaky_llm.call_count == 2
+        assert not provider._locks
+
+    @pytest.mark.asyncio
+    async def test_in_memory_cache_evicts_least_recently_used(self):
+        """Test that the in-process cache keeps at most max_entries responses."""
+        fake_llm = FakeLLM(response="answer")
+        provider = CachingLLMProvider(fake_llm, InMemoryCache(max_entries=2), namespace="mock:test")
+        
+        await provider.generate("a")
+        await provider.generate("b")
+        await provider.generate("a")  # hit, "a" becomes most recently used
+        await provider.generate("c")  # evicts "b"
+        await provider.generate("a")  # still cached
+        await provider.generate("b")  # miss again
+        
+        assert fake_llm.call_count == 4
@@ -9,15 +9,22 @@ from app.infrastructure.persistence import InMemoryRepository
 from tests.unit.fakes import FakeLLM
 
 
+@pytest.fixture
+def use_case_and_llm():
+    """Provide a use case backed by an in-memory repository, and its fake LLM."""
+    fake_llm = FakeLLM(response="Response")
+    use_case = ProcessMessageUseCase(llm=fake_llm, repository=InMemoryRepository())
+    return use_case, fake_llm
+
+
 class TestProcessMessageUseCaseLegacy:
     """Legacy unit tests using infrastructure implementations."""
 
     @pytest.mark.asyncio
-    async def test_execute_calls_llm_generate(self):
+    async def test_execute_calls_llm_generate(self, use_case_and_llm):
         """Test that execute method calls LLM generate with correct message."""
-        fake_llm = FakeLLM(response="Test response")
-        repository = InMemoryRepository()
-        use_case = ProcessMessageUseCase(llm=fake_llm, repository=repository)
+        use_case, fake_llm = use_case_and_llm
+        fake_llm.response = "Test response"
         
         result = await use_case.execute(
             user_id="test_user",
@@ -29,12 +36,11 @@ class TestProcessMessageUseCaseLegacy:
         assert "conversation_id" in result
 
     @pytest.mark.asyncio
-    async def test_execute_preserves_llm_response(self):
+    async def test_execute_preserves_llm_response(self, use_case_and_llm):
         """Test that execute method preserves the exact LLM response."""
+        use_case, fake_llm = use_case_and_llm
         custom_response = "Custom LLM response with special chars: @#$%"
-        fake_llm = FakeLLM(response=custom_response)
-        repository = InMemoryRepository()
-        use_case = ProcessMessageUseCase(llm=fake_llm, repository=repository)
+        fake_llm.response = custom_response
         
         result = await use_case.execute(
             user_id="test_user",
@@ -44,11 +50,9 @@ class TestProcessMessageUseCaseLegacy:
         assert result["response"] == custom_response
 
     @pytest.mark.asyncio
-    async def test_execute_with_conversation_id(self):
+    async def test_execute_with_conversation_id(self, use_case_and_llm):
         """Test that execute method works with conversation ID."""
-        fake_llm = FakeLLM(response="Response")
-        repository = InMemoryRepository()
-        use_case = ProcessMessageUseCase(llm=fake_llm, repository=repository)
+        use_case, _ = use_case_and_llm
         
         # First message
         result1 = await use_case.execute(
@@ -65,4 +69,3 @@ class TestProcessMessageUseCaseLegacy:
         )
         
         assert result2["conversation_id"] == conversation_id
-
@@ -0,0 +1,55 @@
+"""Unit tests for JWTValidator user ID caching."""
+import time
+import pytest
+from jose import jwt
+from app.infrastructure.auth.jwt_validator import JWTValidator
+from app.infrastructure.config.settings import settings
+
+
+SECRET = "unit-test-secret"
+
+
+def _make_token(email: str = "user@example.com", expires_in: int = 3600) -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {"email": email, "iat": now, "exp": now + expires_in},
+        SECRET,
+        algorithm="HS256"
+    )
+
+
+@pytest.fixture
+def validator(monkeypatch):
+    """JWTValidator configured with the unit test secret."""
+    monkeypatch.setattr(settings, "jwt_secret", SECRET)
+    return JWTValidator()
+
+
+class TestJWTValidatorCache:
+    """Unit tests for the validated-token cache in JWTValidator."""
+
+    def test_get_user_id_reuses_validated_token(self, validator, monkeypatch):
+        """Test that a validated token is not re-verified on the next call."""
+        token = _make_token()
+        assert validator.get_user_id(token) == "user@example.com"
+        
+        def fail(_token):
+            raise AssertionError("token should have been served from cache")
+        
+        monkeypatch.setattr(validator, "validate_token", fail)
+        assert validator.get_user_id(token) == "user@example.com"
+
+    def test_get_user_id_revalidates_expired_token(self, validator, monkeypatch):
+        """Test that cached entries are dropped once the token expires."""
+        token = _make_token()
+        validator.get_user_id(token)
+        
+        calls = []
+        original = validator.validate_token
+        monkeypatch.setattr(
+            validator, "validate_token", lambda t: calls.append(t) or original(t)
+        )
+        monkeypatch.setattr(time, "time", lambda: 10 ** 12)
+        
+        assert validator.get_user_id(token) == "user@example.com"
+        assert calls == [token]
@@ -0,0 +1,81 @@
+"""Unit tests for AsyncDynamicBatcher using fakes."""
+import asyncio
+from typing import List
+import pytest
+from app.infrastructure.llm.batcher import AsyncDynamicBatcher
+from tests.unit.fakes import FakeLLM
+
+
+class RecordingLLM(FakeLLM):
+    """FakeLLM that records each batch it receives and echoes the messages."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: List[List[str]] = []
+    
+    async def generate_batch(self, messages: List[str], histories=None) -> List[str]:
+        self.batches.append(list(messages))
+        if self.should_raise:
+            raise self.should_raise
+        return [f"reply to {m}" for m in messages]
+
+
+class FailOnMessageLLM(FakeLLM):
+    """FakeLLM whose generate fails for one message; uses the port's default generate_batch."""
+    
+    def __init__(self, failing_message: str, **kwargs):
+        super().__init__(**kwargs)
+        self.failing_message = failing_message
+    
+    async def generate(self, message: str, history=None) -> str:
+        self.call_count += 1
+        if message == self.failing_message:
+            raise RuntimeError(f"cannot answer {message}")
+        return f"reply to {message}"
+
+
+class TestAsyncDynamicBatcher:
+    """Unit tests for AsyncDynamicBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Test that concurrent generate calls are sent as one batch, in order."""
+        llm = RecordingLLM()
+        batcher = AsyncDynamicBatcher(llm, max_batch_size=32, batch_wait_timeout_s=0.01)
+        
+        results = await asyncio.gather(*(batcher.generate(f"m{i}") for i in range(5)))
+        
+        assert results == [f"reply to m{i}" for i in range(5)]
+        assert llm.batches == [[f"m{i}" for i in range(5)]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_dispatched_immediately(self):
+        """Test that batches are split at max_batch_size."""
+        llm = RecordingLLM()
+        batcher = AsyncDynamicBatcher(llm, max_batch_size=2, batch_wait_timeout_s=10)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.generate(f"m{i}") for i in range(4))),
+            timeout=1
+        )
+        
+        assert len(results) == 4
+        assert [len(batch) for batch in llm.batches] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_failing_message_only_fails_its_own_caller(self):
+        """Test that one failing prompt does not fail the other callers in its batch."""
+        llm = FailOnMessageLLM(failing_message="b")
+        batcher = AsyncDynamicBatcher(llm, batch_wait_timeout_s=0.01)
+        
+        results = await asyncio.gather(
+            batcher.generate("a"),
+            batcher.generate("b"),
+            batcher.generate("c"),
+            return_exceptions=True
+        )
+        
+        assert results[0] == "reply to a"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "reply to c"
+        assert llm.call_count == 3
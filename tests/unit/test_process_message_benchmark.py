@@ -0,0 +1,81 @@
+"""Async microbenchmark for ProcessMessageUseCase.execute.
+
+Requires pytest-async-benchmark (pip install pytest-async-benchmark); skipped
+otherwise. Uses the port fakes, so it measures the use case's own overhead
+(conversation handling, history, persistence calls) without any I/O.
+"""
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("pytest_async_benchmark")
+
+from app.application.use_cases.process_message import ProcessMessageUseCase
+from app.domain.entities.conversation import Conversation
+from app.domain.value_objects.message import Message
+from tests.unit.fakes import FakeLLM, FakeRepository
+
+# Earlier exchanges in the conversation used by the existing-conversation benchmark
+SEEDED_EXCHANGES = 10
+
+
+class FixedHistoryRepository(FakeRepository):
+    """
+    FakeRepository whose stored conversations never change once saved.
+    
+    Each load hands out a fresh copy (as a database load would) and saves of
+    an existing conversation are not kept, so every benchmarked call sees the
+    same seeded history instead of one that grows by two messages per call.
+    """
+    
+    async def save(self, conversation: Conversation) -> Conversation:
+        if conversation.id in self._storage:
+            self.save_count += 1
+            return conversation
+        return await super().save(conversation)
+    
+    async def find_by_id(self, conversation_id: str):
+        conversation = await super().find_by_id(conversation_id)
+        if conversation is None:
+            return None
+        return replace(conversation, messages=list(conversation.messages))
+
+
+@pytest.mark.async_benchmark(rounds=5, iterations=200)
+async def test_bench_execute_new_conversation(async_benchmark):
+    """Benchmark processing a message that starts a new conversation."""
+    use_case = ProcessMessageUseCase(llm=FakeLLM(response="ok"), repository=FakeRepository())
+    
+    result = await async_benchmark(
+        use_case.execute,
+        user_id="bench_user",
+        message_content="hello"
+    )
+    
+    assert result["mean"] > 0
+
+
+@pytest.mark.async_benchmark(rounds=5, iterations=200)
+async def test_bench_execute_existing_conversation(async_benchmark):
+    """Benchmark processing a message in a conversation with a fixed-size history."""
+    repository = FixedHistoryRepository()
+    seeded = await repository.save(Conversation(
+        user_id="bench_user",
+        messages=[
+            Message(content=f"message {i}", role="user" if i % 2 == 0 else "assistant")
+            for i in range(2 * SEEDED_EXCHANGES)
+        ]
+    ))
+    llm = FakeLLM(response="ok")
+    use_case = ProcessMessageUseCase(llm=llm, repository=repository)
+    
+    result = await async_benchmark(
+        use_case.execute,
+        user_id="bench_user",
+        message_content="hello",
+        conversation_id=seeded.id
+    )
+    
+    assert result["mean"] > 0
+    # The last call still saw only the seeded history, not one grown by earlier calls
+    assert len(llm.called_with_history) == 2 * SEEDED_EXCHANGES
@@ -5,6 +5,7 @@ These tests use fake implementations of domain ports to ensure:
 2. Tests are fast and isolated
 3. No external dependencies are required
 """
+import asyncio
 import pytest
 from app.application.use_cases.process_message import ProcessMessageUseCase
 from app.domain.exceptions import LLMError, RepositoryError
@@ -81,6 +82,52 @@ class TestProcessMessageUseCase:
         saved = await fake_repo.find_by_id(conversation_id)
         assert len(saved.messages) == 4
 
+    @pytest.mark.asyncio
+    async def test_execute_handles_concurrent_messages(self):
+        """Test that concurrent executions on one use case keep their conversations separate."""
+        fake_llm = FakeLLM(response="response")
+        fake_repo = FakeRepository()
+        use_case = ProcessMessageUseCase(llm=fake_llm, repository=fake_repo)
+        
+        result1, result2 = await asyncio.gather(
+            use_case.execute(user_id="user1", message_content="Message 1"),
+            use_case.execute(user_id="user2", message_content="Message 2")
+        )
+        
+        assert result1["conversation_id"] != result2["conversation_id"]
+        assert fake_llm.call_count == 2
+        assert fake_repo.save_count == 2
+        
+        saved1 = await fake_repo.find_by_id(result1["conversation_id"])
+        saved2 = await fake_repo.find_by_id(result2["conversation_id"])
+        assert [m.content for m in saved1.messages] == ["Message 1", "response"]
+        assert [m.content for m in saved2.messages] == ["Message 2", "response"]
+
+    @pytest.mark.asyncio
+    async def test_execute_sends_earlier_messages_as_history(self):
+        """Test that earlier turns are passed to the LLM as history."""
+        fake_llm = FakeLLM(response="response")
+        fake_repo = FakeRepository()
+        use_case = ProcessMessageUseCase(llm=fake_llm, repository=fake_repo)
+
+        result = await use_case.execute(
+            user_id="user1",
+            message_content="first message"
+        )
+        assert fake_llm.called_with_history == []
+
+        await use_case.execute(
+            user_id="user1",
+            message_content="second message",
+            conversation_id=result["conversation_id"]
+        )
+
+        assert fake_llm.called_with == "second message"
+        assert [(m.role, m.content) for m in fake_llm.called_with_history] == [
+            ("user", "first message"),
+            ("assistant", "response"),
+        ]
+
     @pytest.mark.asyncio
     async def test_execute_raises_error_when_conversation_not_found(self):
         """Test that execute raises error when conversation_id doesn't exist."""
@@ -95,6 +142,22 @@ class TestProcessMessageUseCase:
                 conversation_id="non-existent-id"
             )
 
+    @pytest.mark.asyncio
+    async def test_execute_skips_lookup_for_malformed_conversation_id(self):
+        """Test that a malformed conversation_id starts a new conversation without a lookup."""
+        fake_llm = FakeLLM(response="response")
+        fake_repo = FakeRepository()
+        use_case = ProcessMessageUseCase(llm=fake_llm, repository=fake_repo)
+
+        result = await use_case.execute(
+            user_id="user1",
+            message_content="message",
+            conversation_id="not-a-uuid"
+        )
+
+        assert fake_repo.find_by_id_count == 0
+        assert result["conversation_id"] != "not-a-uuid"
+
     @pytest.mark.asyncio
     async def test_execute_raises_llm_error_on_llm_failure(self):
         """Test that execute raises LLMError when LLM fails."""
@@ -2,59 +2,78 @@ import pytest
 from pydantic import ValidationError
 from app.api.dto.chat_dto import MessageRequestDTO
 
+MAX_LENGTH_MESSAGE = "A" * 4000
+TOO_LONG_MESSAGE = "A" * 10_000
+SPECIAL_MESSAGE = "Hello! @#$%^&*() 中文 🚀"
+
+
+def validation_errors(body: dict) -> list:
+    """Validate a request body that must be rejected and return its errors."""
+    with pytest.raises(ValidationError) as exc_info:
+        MessageRequestDTO.model_validate(body)
+    return exc_info.value.errors()
+
 
 class TestMessageRequestDTO:
     """Unit tests for MessageRequestDTO schema."""
 
-    def test_message_dto_valid(self):
-        """Test that MessageRequestDTO accepts valid message string."""
-        payload = MessageRequestDTO(message="Hello, world!")
-        assert payload.message == "Hello, world!"
+    @pytest.mark.parametrize(
+        "message",
+        ["Hello, world!", MAX_LENGTH_MESSAGE, SPECIAL_MESSAGE],
+        ids=["plain", "max_length", "special_characters"]
+    )
+    def test_message_dto_accepts_valid_message(self, message):
+        """Test that MessageRequestDTO accepts valid messages up to 4000 characters."""
+        payload = MessageRequestDTO(message=message)
+        assert payload.message == message
 
-    def test_message_dto_with_user_id(self):
-        """Test that MessageRequestDTO accepts user_id."""
+    def test_message_dto_ignores_user_id(self):
+        """Test that MessageRequestDTO does not accept user_id from the body."""
         payload = MessageRequestDTO(message="Hello", user_id="user123")
         assert payload.message == "Hello"
-        assert payload.user_id == "user123"
+        assert not hasattr(payload, "user_id")
 
     def test_message_dto_with_conversation_id(self):
         """Test that MessageRequestDTO accepts conversation_id."""
         payload = MessageRequestDTO(message="Hello", conversation_id="conv123")
         assert payload.conversation_id == "conv123"
 
-    def test_message_dto_empty_string(self):
-        """Test that MessageRequestDTO rejects empty string."""
-        with pytest.raises(ValidationError):
-            MessageRequestDTO(message="")
-
-    def test_message_dto_missing_field(self):
-        """Test that MessageRequestDTO raises error when message field is missing."""
-        with pytest.raises(ValidationError) as exc_info:
-            MessageRequestDTO()
+    @pytest.mark.parametrize(
+        "body,error_type",
+        [
+            ({}, "missing"),
+            ({"message": ""}, "string_too_short"),
+            ({"message": "   "}, "value_error"),
+            ({"message": 123}, "string_type"),
+            ({"message": None}, "string_type"),
+            ({"message": TOO_LONG_MESSAGE}, "string_too_long"),
+        ],
+        ids=["missing", "empty", "whitespace_only", "int", "none", "over_4000_chars"]
+    )
+    def test_message_dto_rejects_invalid_message(self, body, error_type):
+        """Test that MessageRequestDTO rejects missing, empty, non-string and too long messages."""
+        errors = validation_errors(body)
         
-        errors = exc_info.value.errors()
         assert len(errors) == 1
         assert errors[0]["loc"] == ("message",)
-        assert errors[0]["type"] == "missing"
+        assert errors[0]["type"] == error_type
 
-    def test_message_dto_invalid_type(self):
-        """Test that MessageRequestDTO raises error when message is not a string."""
-        with pytest.raises(ValidationError) as exc_info:
-            MessageRequestDTO(message=123)
+    def test_message_dto_rejects_suspicious_content(self):
+        """Test that MessageRequestDTO rejects script injection regardless of case."""
+        errors = validation_errors({"message": "Hi <SCRIPT>alert(1)</SCRIPT>"})
         
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["loc"] == ("message",)
-
-    def test_message_dto_long_message(self):
-        """Test that MessageRequestDTO accepts long messages."""
-        long_message = "A" * 10000
-        payload = MessageRequestDTO(message=long_message)
-        assert payload.message == long_message
+        assert "Pattern detected: <script" in errors[0]["msg"]
 
-    def test_message_dto_special_characters(self):
-        """Test that MessageRequestDTO accepts special characters."""
-        special_message = "Hello! @#$%^&*() 中文 🚀"
-        payload = MessageRequestDTO(message=special_message)
-        assert payload.message == special_message
+    def test_message_dto_construct_matches_validated(self):
+        """Test that model_construct on trusted input builds the same DTO as validation."""
+        constructed = MessageRequestDTO.model_construct(message=MAX_LENGTH_MESSAGE)
+        validated = MessageRequestDTO.model_validate({"message": MAX_LENGTH_MESSAGE})
+        
+        assert constructed.model_dump() == validated.model_dump()
 
+    def test_message_dto_construct_skips_validation(self):
+        """Test that model_construct bypasses validation, so it must only get trusted input."""
+        payload = MessageRequestDTO.model_construct(message="  <script>alert(1)</script>  ")
+        
+        # Neither the whitespace stripping nor the XSS check ran
+        assert payload.message == "  <script>alert(1)</script>  "
@@ -0,0 +1,42 @@
+"""Microbenchmarks for MessageRequestDTO construction.
+
+Requires pytest-benchmark (pip install pytest-benchmark); skipped otherwise.
+Run only the benchmarks with: pytest tests/unit/test_schemas_benchmark.py --benchmark-only
+CI runs them the same way and keeps the results (--benchmark-json) as an artifact.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.api.dto.chat_dto import MessageRequestDTO
+
+# Longest message the DTO accepts, taken from its own constraint so it can't drift
+MAX_MESSAGE_LENGTH = next(
+    m.max_length for m in MessageRequestDTO.model_fields["message"].metadata
+    if hasattr(m, "max_length")
+)
+MAX_LENGTH_MESSAGE = "A" * MAX_MESSAGE_LENGTH
+
+
+def test_bench_constructor(benchmark):
+    """Benchmark building the DTO through its validating constructor."""
+    payload = benchmark(MessageRequestDTO, message="hello")
+    assert payload.message == "hello"
+
+
+def test_bench_model_validate(benchmark):
+    """Benchmark validating a request body dict, as FastAPI does."""
+    payload = benchmark(MessageRequestDTO.model_validate, {"message": "hello"})
+    assert payload.message == "hello"
+
+
+def test_bench_model_validate_max_length(benchmark):
+    """Benchmark validating a maximum-length message (XSS scan over the whole message)."""
+    payload = benchmark(MessageRequestDTO.model_validate, {"message": MAX_LENGTH_MESSAGE})
+    assert payload.message == MAX_LENGTH_MESSAGE
+
+
+def test_bench_model_construct(benchmark):
+    """Benchmark building the DTO without validation (trusted input only)."""
+    payload = benchmark(MessageRequestDTO.model_construct, message="hello")
+    assert payload.message == "hello"
@@ -0,0 +1,48 @@
+"""Unit tests for SemanticCachingLLMProvider using fakes."""
+import pytest
+from tests.unit.fakes import FakeLLM
+
+pytest.importorskip("numpy")
+
+from app.domain.value_objects.message import Message
+from app.infrastructure.llm.semantic_cache import SemanticCache, SemanticCachingLLMProvider
+
+# Prompts that mean the same thing get (nearly) the same embedding
+EMBEDDINGS = {
+    "Explain quantum computing": [1.0, 0.0, 0.0],
+    "Break down quantum computing": [0.99, 0.05, 0.0],
+    "Recommend a pasta recipe": [0.0, 1.0, 0.0],
+}
+
+
+async def fake_embed(text):
+    return EMBEDDINGS[text]
+
+
+class TestSemanticCachingLLMProvider:
+    """Unit tests for SemanticCachingLLMProvider."""
+
+    @pytest.mark.asyncio
+    async def test_paraphrased_prompt_is_served_from_cache(self):
+        """Test that a similar prompt reuses the cached response."""
+        fake_llm = FakeLLM(response="answer")
+        provider = SemanticCachingLLMProvider(fake_llm, fake_embed, SemanticCache(max_entries=8))
+        
+        await provider.generate("Explain quantum computing")
+        result = await provider.generate("Break down quantum computing")
+        
+        assert result == "answer"
+        assert fake_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_prompt_and_history_miss(self):
+        """Test that dissimilar prompts and prompts with history reach the provider."""
+        fake_llm = FakeLLM(response="answer")
+        provider = SemanticCachingLLMProvider(fake_llm, fake_embed, SemanticCache(max_entries=8))
+        history = [Message(content="hi", role="user")]
+        
+        await provider.generate("Explain quantum computing")
+        await provider.generate("Recommend a pasta recipe")
+        await provider.generate("Explain quantum computing", history=history)
+        
+        assert fake_llm.call_count == 3